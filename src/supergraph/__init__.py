@@ -44,6 +44,7 @@ from .core import (
     NormalizedQuery,
     NormalizedSelectionNode,
     PaginationInfo,
+    PlanningError,
     QueryValidator,
     RefDef,
     RefIR,
@@ -114,6 +115,7 @@ __all__ = [
     "SupergraphError",
     "ValidationError",
     "ExecutionError",
+    "PlanningError",
     "ServiceError",
     "GraphConfigError",
     "IAMError",
@@ -42,22 +42,23 @@ from __future__ import annotations
 import json
 from typing import Any, Optional
 
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import PlainTextResponse
 
-from ..core.errors import ExecutionError, IAMError, ServiceError, ValidationError
+from ..core.errors import ExecutionError, IAMError, PlanningError, ServiceError, ValidationError
 from ..core.typescript_generator import generate_typescript
 from ..core.query_types import JSONQuery, MutationResult, TransactionResult
 from ..core.request_parser import ParsedRequest, RequestParser, EntityQuery
 from ..core.validator import QueryValidator
-from ..iam.guard import filter_masked_fields, filter_masked_relations, inject_guards
-from ..iam.service import iam_service
+from ..iam.guard import apply_iam
+from ..iam.service import get_access_index, iam_service
 from ..runtime.assembler import ResponseAssembler
 from ..runtime.context import ExecutionContext, Principal
 from ..runtime.executor import PlanExecutor
 from ..runtime.mutation_executor import MutationExecutor
 from ..runtime.planner import QueryPlanner
-from ..runtime.service_client import ServiceClient
+from ..runtime.service_client import ServiceClient, create_http_client
 from ..runtime.transaction_executor import TransactionExecutor
 
 
@@ -66,6 +67,7 @@ router = APIRouter()
 
 # Global instances (will be set by create_app or dependency injection)
 _graph: dict | None = None
+_http_client: httpx.AsyncClient | None = None
 _service_client: ServiceClient | None = None
 _mutation_executor: MutationExecutor | None = None
 
@@ -74,7 +76,10 @@ def set_graph(graph: dict):
     """Set the graph schema for the API."""
     global _graph, _mutation_executor
     _graph = graph
-    _mutation_executor = MutationExecutor(graph)
+    # Built lazily by get_mutation_executor() around the current HTTP client
+    _mutation_executor = None
+    # Warm IAM access index so the first request doesn't pay for it
+    get_access_index(graph)
 
 
 def get_graph() -> dict:
@@ -84,18 +89,44 @@ def get_graph() -> dict:
     return _graph
 
 
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the HTTP client shared by queries and mutations."""
+    global _http_client
+    if _http_client is None:
+        _http_client = create_http_client()
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client and its connection pool (app shutdown)."""
+    global _http_client, _service_client, _mutation_executor
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        # Both hold the closed client - rebuilt around a new one on next use
+        _service_client = None
+        _mutation_executor = None
+
+
+# Included with the router, so every app mounting it closes the pool on exit
+router.add_event_handler("shutdown", close_http_client)
+
+
 def get_service_client() -> ServiceClient:
     """Get or create service client."""
     global _service_client
     if _service_client is None:
-        _service_client = ServiceClient()
+        _service_client = ServiceClient(http_client=get_http_client())
     return _service_client
 
 
 def get_mutation_executor() -> MutationExecutor:
-    """Get mutation executor."""
+    """Get or create mutation executor."""
+    global _mutation_executor
     if _mutation_executor is None:
-        raise RuntimeError("Mutation executor not initialized. Call set_graph() first.")
+        if _graph is None:
+            raise RuntimeError("Mutation executor not initialized. Call set_graph() first.")
+        _mutation_executor = MutationExecutor(_graph, http_client=get_http_client())
     return _mutation_executor
 
 
@@ -330,7 +361,7 @@ async def execute_request(
     try:
         parsed = parser.parse(body)
     except ValidationError as e:
-        raise HTTPException(status_code=400, detail={"error": str(e)})
+        raise HTTPException(status_code=400, detail={"error": str(e)}) from e
 
     # Build response
     response: dict[str, Any] = {}
@@ -364,6 +395,8 @@ async def _execute_queries(
 ) -> dict[str, Any]:
     """Execute multiple queries and return results."""
     results = {}
+    # Shared across the request so IAM decisions are evaluated once per entity
+    context = ExecutionContext(graph=graph, principal=principal)
 
     for entity, entity_query in queries.items():
         # Convert EntityQuery to JSONQuery for existing pipeline
@@ -387,7 +420,7 @@ async def _execute_queries(
             },
         )
 
-        result = await _execute_single_query(json_query, graph, principal)
+        result = await _execute_single_query(json_query, graph, principal, context)
         results[entity] = result
 
     return results
@@ -416,8 +449,12 @@ async def _execute_single_query(
     query: JSONQuery,
     graph: dict,
     principal: Principal,
+    context: Optional[ExecutionContext] = None,
 ) -> dict[str, Any]:
     """Execute a single query through the existing pipeline."""
+    if context is None:
+        context = ExecutionContext(graph=graph, principal=principal)
+
     # 1. Validate and normalize
     validator = QueryValidator(graph)
     errors, normalized_query = validator.validate_and_normalize(query)
@@ -430,31 +467,30 @@ async def _execute_single_query(
 
     # 2. IAM check
     try:
-        iam_response = await iam_service.check_access(
-            principal=principal,
+        iam_response = await iam_service.check_access_cached(
+            context,
             action=query.action,
             entity=query.entity,
-            graph=graph,
         )
 
         if not iam_response.allow:
             raise IAMError("Access denied")
 
     except IAMError as e:
-        raise HTTPException(status_code=403, detail={"error": str(e)})
+        raise HTTPException(status_code=403, detail={"error": str(e)}) from e
 
     # 3. Plan execution
     planner = QueryPlanner(graph)
-    steps = planner.plan(normalized_query)
+    try:
+        steps = planner.plan(normalized_query)
+    except PlanningError as e:
+        raise HTTPException(status_code=400, detail={"errors": [str(e)]}) from e
 
-    # 4. Inject IAM guards
-    steps = inject_guards(steps, iam_response, graph)
-    steps = filter_masked_fields(steps, iam_response)
-    steps = filter_masked_relations(steps, iam_response)
+    # 4. Inject IAM guards, mask fields and drop masked relations
+    steps = apply_iam(steps, iam_response, graph)
 
     # 5. Execute steps
     try:
-        context = ExecutionContext(graph=graph, principal=principal)
         client = get_service_client()
         executor = PlanExecutor(client)
         results = await executor.execute(steps, context)
@@ -463,12 +499,12 @@ async def _execute_single_query(
         raise HTTPException(
             status_code=502,
             detail={"error": f"Service error: {e.service}", "message": str(e)},
-        )
+        ) from e
     except ExecutionError as e:
         raise HTTPException(
             status_code=500,
             detail={"error": "Execution error", "step": e.step_id, "message": str(e)},
-        )
+        ) from e
 
     # 6. Assemble response
     assembler = ResponseAssembler()
@@ -488,14 +524,10 @@ async def _execute_mutations(
 ) -> list[MutationResult]:
     """Execute mutations."""
     executor = get_mutation_executor()
-    results = []
-
-    for mutation in mutations:
-        # TODO: Add IAM check for mutations
-        result = await executor.execute(mutation)
-        results.append(result)
 
-    return results
+    # TODO: Add IAM check for mutations
+    # In request order, consecutive mutations of a service in one request
+    return await executor.execute_batch(mutations)
 
 
 async def _execute_transaction(
@@ -20,6 +20,7 @@ from .errors import (
     ExecutionError,
     GraphConfigError,
     IAMError,
+    PlanningError,
     ServiceError,
     SupergraphError,
     ValidationError,
@@ -29,6 +30,9 @@ from .query_types import (
     InternalQueryResponse,
     InternalMutationRequest,
     InternalMutationResponse,
+    InternalBatchRequest,
+    InternalBatchResult,
+    InternalBatchResponse,
     JSONQuery,
     MutationResult,
     NormalizedFilter,
@@ -89,6 +93,7 @@ __all__ = [
     "SupergraphError",
     "ValidationError",
     "ExecutionError",
+    "PlanningError",
     "ServiceError",
     "GraphConfigError",
     "IAMError",
@@ -103,6 +108,9 @@ __all__ = [
     "InternalQueryResponse",
     "InternalMutationRequest",
     "InternalMutationResponse",
+    "InternalBatchRequest",
+    "InternalBatchResult",
+    "InternalBatchResponse",
     "MutationResult",
     "TransactionResult",
     "PaginationInfo",
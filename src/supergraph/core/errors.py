@@ -29,6 +29,14 @@ class ExecutionError(SupergraphError):
         super().__init__(f"Execution failed{f' at step {step_id}' if step_id else ''}: {message}")
 
 
+class PlanningError(SupergraphError, ValueError):
+    """Raised when a query can't be planned against the graph."""
+
+    def __init__(self, message: str, path: Optional[str] = None):
+        self.path = path
+        super().__init__(f"{path}: {message}" if path else message)
+
+
 class ServiceError(SupergraphError):
     """Raised when a backend service call fails."""
 
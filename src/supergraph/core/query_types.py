@@ -184,6 +184,27 @@ class InternalMutationResponse(BaseModel):
     count: int = 0  # Number of affected rows
 
 
+class InternalBatchRequest(BaseModel):
+    """
+    Request format for batched internal mutations.
+
+    POST /internal/batch
+
+    Operations run in order; each one is handled like its single endpoint.
+    """
+    operations: list[InternalMutationRequest]
+
+
+class InternalBatchResult(InternalMutationResponse):
+    """Result of one operation in a batch (error is set if it failed)."""
+    error: Optional[str] = None
+
+
+class InternalBatchResponse(BaseModel):
+    """Response format for batched internal mutations (one result per operation)."""
+    results: list[InternalBatchResult] = Field(default_factory=list)
+
+
 class MutationResult(BaseModel):
     """Result of a single mutation operation."""
     entity: str
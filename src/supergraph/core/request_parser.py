@@ -156,6 +156,21 @@ class EntityMutation:
         )
 
 
+def _contains_ref(value: Any) -> bool:
+    """Check if any string in a nested dict/list could hold a $variable reference."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if "$" in item:
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return False
+
+
 @dataclass
 class TransactionStep:
     """Single step in a transaction."""
@@ -167,6 +182,11 @@ class TransactionStep:
     alias: Optional[str] = None  # Variable name for referencing ($person)
     depends_on: Optional[List[str]] = None  # Explicit dependencies
     optional: bool = False  # If true, failure doesn't trigger rollback
+    has_refs: bool = field(init=False)  # data/filters reference variables
+
+    def __post_init__(self):
+        # Scanned once, so the executor can skip resolving ref-free steps
+        self.has_refs = _contains_ref(self.data) or _contains_ref(self.filters)
 
     @classmethod
     def from_dict(cls, step_data: dict) -> "TransactionStep":
@@ -0,0 +1,84 @@
+"""
+Serialization helpers.
+
+JSON uses orjson when installed (pip install supergraph[fast]) and falls
+back to the stdlib json module otherwise. MessagePack (pip install
+supergraph[msgpack]) is available for internal service-to-service traffic.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+HAS_ORJSON = orjson is not None
+HAS_MSGPACK = msgpack is not None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def json_dumps(value: Any) -> Union[bytes, str]:
+        """
+        Serialize value to JSON.
+
+        Unknown types are converted with str(). Returns bytes with orjson,
+        str with the stdlib fallback - both are accepted by Redis and httpx.
+        """
+        return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS)
+
+    def json_loads(data: Union[bytes, bytearray, str]) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return orjson.loads(data)
+
+else:
+
+    def json_dumps(value: Any) -> Union[bytes, str]:
+        """
+        Serialize value to JSON.
+
+        Unknown types are converted with str(). Returns bytes with orjson,
+        str with the stdlib fallback - both are accepted by Redis and httpx.
+        """
+        return json.dumps(value, ensure_ascii=False, default=str)
+
+    def json_loads(data: Union[bytes, bytearray, str]) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return json.loads(data)
+
+
+def msgpack_dumps(value: Any) -> bytes:
+    """Serialize value to MessagePack (unknown types are converted with str())."""
+    if msgpack is None:
+        raise ImportError("msgpack is not installed (pip install supergraph[msgpack])")
+    return msgpack.packb(value, use_bin_type=True, default=str)
+
+
+def msgpack_loads(data: bytes) -> Any:
+    """Deserialize MessagePack bytes."""
+    if msgpack is None:
+        raise ImportError("msgpack is not installed (pip install supergraph[msgpack])")
+    return msgpack.unpackb(data, raw=False)
+
+
+def is_msgpack_map(data: Union[bytes, str]) -> bool:
+    """
+    Check if payload is a MessagePack-encoded map.
+
+    JSON text never starts with these bytes, so JSON and MessagePack
+    payloads can share a channel.
+    """
+    if not isinstance(data, (bytes, bytearray)) or not data:
+        return False
+    first = data[0]
+    return 0x80 <= first <= 0x8F or first in (0xDE, 0xDF)
@@ -6,14 +6,16 @@ from __future__ import annotations
 
 from typing import Optional
 
-from .guard import filter_masked_fields, filter_masked_relations, inject_guards
-from .service import IAMResponse, IAMScope, IAMService, iam_service
+from .guard import apply_iam, filter_masked_fields, filter_masked_relations, inject_guards
+from .service import PRINCIPAL_UPDATED_CHANNEL, IAMResponse, IAMScope, IAMService, iam_service
 
 __all__ = [
     "IAMScope",
     "IAMResponse",
     "IAMService",
     "iam_service",
+    "PRINCIPAL_UPDATED_CHANNEL",
+    "apply_iam",
     "inject_guards",
     "filter_masked_fields",
     "filter_masked_relations",
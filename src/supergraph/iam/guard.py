@@ -11,7 +11,77 @@ from typing import Optional
 
 from ..core.query_types import NormalizedFilter
 from ..runtime.planner import PlanStep
-from .service import IAMResponse
+from .service import DEFAULT_ACCESS, IAMResponse, get_access_index
+
+
+def apply_iam(
+    steps: list[PlanStep],
+    iam_response: IAMResponse,
+    graph: dict,
+) -> list[PlanStep]:
+    """
+    Apply all IAM restrictions to plan steps in a single pass.
+
+    Equivalent to running inject_guards, filter_masked_fields and
+    filter_masked_relations in sequence, but walks the steps only once.
+
+    Args:
+        steps: List of plan steps to modify
+        iam_response: IAM check result with scopes and masks
+        graph: Supergraph schema
+
+    Returns:
+        Filtered list of steps (masked relation subtrees removed,
+        remaining steps guarded and field-masked in place)
+    """
+    # Fast path: unrestricted response, nothing to apply
+    scopes = iam_response.scopes
+    if not (scopes or iam_response.field_masks or iam_response.relation_masks):
+        return steps
+
+    access_index = get_access_index(graph)
+    mask_sets = iam_response.field_mask_sets
+    masked_relations = {
+        (entity, relation)
+        for entity, relations in iam_response.relation_masks.items()
+        for relation in relations
+    }
+
+    # Steps are in planner order (parents before children), so the map
+    # can be filled while walking
+    step_map: dict[str, PlanStep] = {}
+    dropped: set[str] = set()
+    filtered: list[PlanStep] = []
+
+    for step in steps:
+        step_map[step.id] = step
+
+        # Drop steps for masked relations together with their subtrees
+        if masked_relations and step.depends_on:
+            if step.depends_on in dropped:
+                dropped.add(step.id)
+                continue
+            if step.attach_as:
+                parent_step = step_map.get(step.depends_on)
+                if parent_step and not _unmask_attachments(step, parent_step.entity, masked_relations):
+                    dropped.add(step.id)
+                    continue
+
+        # Mask fields
+        masked = mask_sets.get(step.entity)
+        if masked is not None:
+            step.select_fields = tuple(f for f in step.select_fields if f not in masked)
+
+        # Inject guards (only direct tenant strategy is supported for now)
+        if scopes and access_index.get(step.entity, DEFAULT_ACCESS)[0] == "direct":
+            step.guard += tuple(
+                NormalizedFilter(field=scope.field, op=scope.op, value=scope.values)
+                for scope in scopes
+            )
+
+        filtered.append(step)
+
+    return filtered
 
 
 def inject_guards(
@@ -33,12 +103,13 @@ def inject_guards(
     Returns:
         Modified list of steps (same objects, modified in place)
     """
-    entities = graph.get("entities", {})
+    if not iam_response.scopes:
+        return steps
+
+    access_index = get_access_index(graph)
 
     for step in steps:
-        entity_def = entities.get(step.entity, {})
-        access_def = entity_def.get("access", {})
-        tenant_strategy = access_def.get("tenant_strategy", "none")
+        tenant_strategy = access_index.get(step.entity, DEFAULT_ACCESS)[0]
 
         # Apply scopes as guards based on entity's tenant strategy
         if tenant_strategy == "direct":
@@ -49,7 +120,7 @@ def inject_guards(
                     op=scope.op,
                     value=scope.values,
                 )
-                step.guard.append(guard_filter)
+                step.guard += (guard_filter,)
 
         elif tenant_strategy == "via_relations":
             # Via relations strategy: more complex, requires prefetch
@@ -79,10 +150,14 @@ def filter_masked_fields(
     Returns:
         Modified list of steps
     """
+    mask_sets = iam_response.field_mask_sets
+    if not mask_sets:
+        return steps
+
     for step in steps:
-        masked = iam_response.field_masks.get(step.entity, [])
-        if masked:
-            step.select_fields = [f for f in step.select_fields if f not in masked]
+        masked = mask_sets.get(step.entity)
+        if masked is not None:
+            step.select_fields = tuple(f for f in step.select_fields if f not in masked)
 
     return steps
 
@@ -102,33 +177,67 @@ def filter_masked_relations(
         iam_response: IAM check result with relation masks
 
     Returns:
-        Filtered list of steps (masked relation steps removed)
+        Filtered list of steps (masked relation steps and their
+        descendants removed)
     """
+    if not iam_response.relation_masks:
+        return steps
+
     # Build set of masked relations per entity
     # relation_masks format: {entity: [relation_names]}
-    masked_relations: set[tuple[str, str]] = set()
-    for entity, relations in iam_response.relation_masks.items():
-        for relation in relations:
-            masked_relations.add((entity, relation))
-
-    # Find root step
-    root_step = next((s for s in steps if s.depends_on is None), None)
-    if not root_step:
-        return steps
+    masked_relations = {
+        (entity, relation)
+        for entity, relations in iam_response.relation_masks.items()
+        for relation in relations
+    }
 
     # Filter out masked relation steps
-    # We need to remove steps where (parent_entity, attach_as) is masked
-    step_map = {s.id: s for s in steps}
+    # We need to remove steps where (parent_entity, attach_as) is masked.
+    # Steps are in planner order (parents before children), so the parent
+    # lookup map is filled while walking.
+    step_map: dict[str, PlanStep] = {}
+    dropped: set[str] = set()
     filtered: list[PlanStep] = []
 
     for step in steps:
-        if step.depends_on and step.attach_as:
-            parent_step = step_map.get(step.depends_on)
-            if parent_step:
+        step_map[step.id] = step
+        if step.depends_on:
+            # Children of a dropped step can't be attached anywhere
+            if step.depends_on in dropped:
+                dropped.add(step.id)
+                continue
+            if step.attach_as:
+                parent_step = step_map.get(step.depends_on)
                 # Check if this relation is masked
-                if (parent_step.entity, step.attach_as) in masked_relations:
-                    # Skip this step and all its children
+                if parent_step and not _unmask_attachments(step, parent_step.entity, masked_relations):
+                    dropped.add(step.id)
                     continue
         filtered.append(step)
 
     return filtered
+
+
+def _unmask_attachments(
+    step: PlanStep,
+    parent_entity: str,
+    masked_relations: set[tuple[str, str]],
+) -> bool:
+    """
+    Remove masked relation names from a step's attachments.
+
+    A fused step attaches under several names (attach_as plus
+    alias_attach_as); only the masked ones are removed.
+
+    Returns:
+        False if every attachment is masked (the step must be dropped)
+    """
+    if not step.alias_attach_as:
+        return (parent_entity, step.attach_as) not in masked_relations
+
+    attachments = [(step.attach_as, step.cardinality), *step.alias_attach_as]
+    kept = [a for a in attachments if (parent_entity, a[0]) not in masked_relations]
+    if not kept:
+        return False
+    if len(kept) < len(attachments):
+        (step.attach_as, step.cardinality), step.alias_attach_as = kept[0], kept[1:]
+    return True
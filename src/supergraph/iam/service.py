@@ -6,25 +6,96 @@ Handles access control decisions and returns scopes/masks.
 
 from __future__ import annotations
 
+import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any
+from functools import cached_property
+from typing import Any, Callable, Optional, Sequence
 
-from ..runtime.context import Principal
+from ..runtime.context import ExecutionContext, Principal
 
+# Channel on which principal changes (roles, tenants) are announced
+PRINCIPAL_UPDATED_CHANNEL = "iam.principal.updated"
 
-@dataclass
+# Access metadata for entities without an access definition
+DEFAULT_ACCESS: tuple[str, str] = ("none", "rc_id")
+
+# Where tenant values come from for each supported tenant field
+_TENANT_FIELD_SOURCES: dict[str, Callable[[Principal], Sequence[Any]]] = {
+    # Residential complex filtering
+    "rc_id": lambda p: p.rc_ids,
+    # Company filtering
+    "company_id": lambda p: p.extra.get("company_ids") or (),
+    # Special case: Company entity filters by its own id field
+    "id": lambda p: p.extra.get("company_ids") or (),
+}
+
+
+def _no_tenant_values(principal: Principal) -> Sequence[Any]:
+    return ()
+
+
+# Per-graph access index cache (LRU): id(graph) -> (graph, index). Bounded,
+# so graphs replaced by hot reloads or tests don't stay alive forever.
+ACCESS_INDEX_CACHE_SIZE = 8
+_access_indexes: OrderedDict[int, tuple[dict, dict[str, tuple[str, str]]]] = OrderedDict()
+
+
+def build_access_index(graph: dict) -> dict[str, tuple[str, str]]:
+    """
+    Build entity -> (tenant_strategy, tenant_field) lookup for a graph.
+
+    Args:
+        graph: The supergraph schema
+
+    Returns:
+        Mapping of entity name to its tenant strategy and tenant field
+    """
+    index: dict[str, tuple[str, str]] = {}
+    for entity_name, entity_def in graph.get("entities", {}).items():
+        access_def = entity_def.get("access") or {}
+        index[entity_name] = (
+            access_def.get("tenant_strategy", "none"),
+            access_def.get("tenant_field", "rc_id"),
+        )
+    return index
+
+
+def get_access_index(graph: dict) -> dict[str, tuple[str, str]]:
+    """
+    Get the access index for a graph, building it on first use.
+
+    The index is cached per graph object (not stored inside the graph,
+    so it never leaks into /__graph responses).
+    """
+    cached = _access_indexes.get(id(graph))
+    if cached is not None and cached[0] is graph:
+        _access_indexes.move_to_end(id(graph))
+        return cached[1]
+    index = build_access_index(graph)
+    _access_indexes[id(graph)] = (graph, index)
+    _access_indexes.move_to_end(id(graph))
+    if len(_access_indexes) > ACCESS_INDEX_CACHE_SIZE:
+        _access_indexes.popitem(last=False)
+    return index
+
+
+@dataclass(frozen=True)
 class IAMScope:
-    """A single scope restriction from IAM."""
+    """A single scope restriction from IAM (immutable, hashable)."""
     field: str
     op: str
-    values: list[Any]
+    values: tuple[Any, ...]
 
 
-@dataclass
+@dataclass(frozen=True)
 class IAMResponse:
     """
     Response from IAM access check.
 
+    Immutable - responses are cached and shared between requests.
+
     Contains:
     - allow: Whether the action is allowed
     - scopes: Mandatory filter restrictions (e.g., rc_id IN [1,2,3])
@@ -32,10 +103,19 @@ class IAMResponse:
     - relation_masks: Relations to hide per entity
     """
     allow: bool = True
-    scopes: list[IAMScope] = field(default_factory=list)
+    scopes: tuple[IAMScope, ...] = ()
     field_masks: dict[str, list[str]] = field(default_factory=dict)  # entity -> hidden fields
     relation_masks: dict[str, list[str]] = field(default_factory=dict)  # entity -> hidden relations
 
+    @cached_property
+    def field_mask_sets(self) -> dict[str, frozenset[str]]:
+        """Field masks as frozensets (built once, O(1) membership checks)."""
+        return {
+            entity: frozenset(fields)
+            for entity, fields in self.field_masks.items()
+            if fields
+        }
+
 
 class IAMService:
     """
@@ -48,8 +128,59 @@ class IAMService:
     Production would:
     - Check roles and permissions
     - Return appropriate scopes and masks
+
+    Decisions are memoized in a small LRU cache with a TTL, keyed by
+    principal, action, entity and the principal's tenant values.
+    Cached IAMResponse objects are shared and must be treated as read-only.
+
+    Invalidation on principal changes:
+        from supergraph.messaging import redis_subscribe
+
+        redis_subscribe(PRINCIPAL_UPDATED_CHANNEL)(iam_service.on_principal_updated)
     """
 
+    def __init__(self, cache_size: int = 1024, cache_ttl: float = 60.0):
+        """
+        Initialize IAM service.
+
+        Args:
+            cache_size: Max cached decisions (0 disables caching)
+            cache_ttl: Seconds a cached decision stays valid
+        """
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache: OrderedDict[tuple, tuple[float, dict, IAMResponse]] = OrderedDict()
+        # Canonical scope objects: identical scopes are shared across entities
+        self._scopes: weakref.WeakValueDictionary[tuple, IAMScope] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def _intern_scope(self, field: str, op: str, values: tuple[Any, ...]) -> IAMScope:
+        """Return the canonical IAMScope for (field, op, values)."""
+        key = (field, op, values)
+        scope = self._scopes.get(key)
+        if scope is None:
+            scope = IAMScope(field=field, op=op, values=values)
+            self._scopes[key] = scope
+        return scope
+
+    def invalidate(self, principal_id: Optional[Any] = None) -> None:
+        """
+        Drop cached decisions.
+
+        Args:
+            principal_id: Only drop entries for this principal (all if None)
+        """
+        if principal_id is None:
+            self._cache.clear()
+            return
+        for key in [k for k in self._cache if k[1] == principal_id]:
+            del self._cache[key]
+
+    def on_principal_updated(self, data: dict) -> None:
+        """Pub/Sub handler: invalidate cache for the principal in event data."""
+        self.invalidate(data.get("id") if isinstance(data, dict) else None)
+
     async def check_access(
         self,
         principal: Principal,
@@ -69,43 +200,88 @@ class IAMService:
         Returns:
             IAMResponse with allow/deny and any restrictions
         """
+        cache_key = None
+        if self.cache_size > 0:
+            cache_key = (
+                id(graph),
+                principal.id,
+                action,
+                entity,
+                tuple(principal.rc_ids or ()),
+                tuple(principal.extra.get("company_ids") or ()),
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                expires_at, cached_graph, response = cached
+                # id() of a freed graph can be reused by a reloaded one
+                if expires_at > time.monotonic() and cached_graph is graph:
+                    self._cache.move_to_end(cache_key)
+                    return response
+                del self._cache[cache_key]
+
+        response = self._evaluate(principal, action, entity, graph)
+
+        if cache_key is not None:
+            self._cache[cache_key] = (time.monotonic() + self.cache_ttl, graph, response)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return response
+
+    async def check_access_cached(
+        self,
+        context: ExecutionContext,
+        action: str,
+        entity: str,
+    ) -> IAMResponse:
+        """
+        Check access, memoized for the lifetime of one request.
+
+        Args:
+            context: Execution context of the current request
+            action: The action being performed
+            entity: The entity being accessed
+
+        Returns:
+            IAMResponse (shared within the request)
+        """
+        key = (action, entity)
+        response = context.iam_cache.get(key)
+        if response is None:
+            response = await self.check_access(
+                principal=context.principal,
+                action=action,
+                entity=entity,
+                graph=context.graph,
+            )
+            context.iam_cache[key] = response
+        return response
+
+    def _evaluate(
+        self,
+        principal: Principal,
+        action: str,
+        entity: str,
+        graph: dict,
+    ) -> IAMResponse:
+        """Compute the access decision (uncached)."""
         # MVP: Allow all requests
         # In production, check roles/permissions here
 
         # Get entity access definition
-        entity_def = graph.get("entities", {}).get(entity, {})
-        access_def = entity_def.get("access", {})
-        tenant_strategy = access_def.get("tenant_strategy", "none")
+        tenant_strategy, tenant_field = get_access_index(graph).get(entity, DEFAULT_ACCESS)
 
-        scopes: list[IAMScope] = []
+        scopes: tuple[IAMScope, ...] = ()
 
         # Apply tenant restrictions based on strategy
         if tenant_strategy == "direct":
-            tenant_field = access_def.get("tenant_field", "rc_id")
-
             # Determine which tenant values to use based on the field
-            tenant_values = []
-
-            if tenant_field == "rc_id" and principal.rc_ids:
-                # Use rc_ids for residential complex filtering
-                tenant_values = principal.rc_ids
-            elif tenant_field == "company_id" and principal.extra.get("company_ids"):
-                # Use company_ids from extra for company filtering
-                tenant_values = principal.extra["company_ids"]
-            elif tenant_field == "id" and principal.extra.get("company_ids"):
-                # Special case: Company entity filters by its own id field
-                # Use company_ids from extra
-                tenant_values = principal.extra["company_ids"]
+            source = _TENANT_FIELD_SOURCES.get(tenant_field, _no_tenant_values)
+            tenant_values = source(principal)
 
             # Add scope if we have tenant values
             if tenant_values:
-                scopes.append(
-                    IAMScope(
-                        field=tenant_field,
-                        op="in",
-                        values=tenant_values,
-                    )
-                )
+                scopes = (self._intern_scope(tenant_field, "in", tuple(tenant_values)),)
 
         return IAMResponse(
             allow=True,
@@ -59,7 +59,9 @@ from .client import (
 from .pubsub import (
     RedisPublisher,
     RedisSubscriber,
+    get_publisher,
     redis_publish,
+    redis_publish_many,
     redis_subscribe,
     get_global_subscriber,
 )
@@ -71,6 +73,7 @@ from .events import (
     EventConfig,
     EventPublisher,
     publish_model_event,
+    publish_model_events,
 )
 
 __all__ = [
@@ -82,7 +85,9 @@ __all__ = [
     # Pub/Sub
     "RedisPublisher",
     "RedisSubscriber",
+    "get_publisher",
     "redis_publish",
+    "redis_publish_many",
     "redis_subscribe",
     "get_global_subscriber",
     # Cache
@@ -92,4 +97,5 @@ __all__ = [
     "EventConfig",
     "EventPublisher",
     "publish_model_event",
+    "publish_model_events",
 ]
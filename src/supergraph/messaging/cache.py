@@ -6,16 +6,25 @@ Distributed cache decorator для Redis.
 
 from __future__ import annotations
 
+import asyncio
 import functools
-import json
+import inspect
 import logging
+import string
 from typing import Any, Callable, Optional
 
+from ..core.serialization import json_dumps, json_loads
 from .client import get_redis_client
-from .pubsub import RedisSubscriber
+from .pubsub import get_global_subscriber
 
 logger = logging.getLogger(__name__)
 
+# Keys per SCAN page / UNLINK call in CacheManager.invalidate_pattern
+INVALIDATE_BATCH_SIZE = 500
+
+# In-flight backend calls per cache key (coalesces concurrent misses)
+_inflight: dict[str, asyncio.Future] = {}
+
 
 def redis_cache(
     key: str,
@@ -58,29 +67,42 @@ def redis_cache(
     """
 
     def decorator(func: Callable):
+        # Inspect signature and compile key pattern once at decoration time
+        param_names, defaults = _inspect_params(func)
+        build_positional_key = _compile_positional_key(key, prefix, param_names, defaults)
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             # Build cache key from pattern and function arguments
-            cache_key = _build_cache_key(key, prefix, func, args, kwargs)
+            cache_key = None
+            if build_positional_key is not None and not kwargs:
+                cache_key = build_positional_key(args)
+            if cache_key is None:
+                cache_key = _build_cache_key(
+                    key, prefix, func, args, kwargs, param_names, defaults
+                )
 
             # Try to get from cache
             client = get_redis_client()
             try:
-                cached = await client.get(cache_key)
+                cached = await client.raw.get(cache_key)
                 if cached:
                     logger.debug(f"Cache HIT: {cache_key}")
-                    return json.loads(cached)
+                    return json_loads(cached)
             except Exception as e:
                 logger.warning(f"Cache read error for {cache_key}: {e}")
                 # Continue to function call on cache error
 
-            # Cache miss - call function
+            # Cache miss - call function (once for concurrent misses on the same key)
             logger.debug(f"Cache MISS: {cache_key}")
-            result = await func(*args, **kwargs)
+            result, is_leader = await _call_coalesced(cache_key, func, args, kwargs)
+            if not is_leader:
+                # Another caller fetched and is caching this value
+                return result
 
             # Cache result
             try:
-                payload = json.dumps(result, ensure_ascii=False, default=str)
+                payload = json_dumps(result)
                 await client.set(cache_key, payload, ex=ttl)
                 logger.debug(f"Cached result for {cache_key} (TTL: {ttl}s)")
             except Exception as e:
@@ -98,12 +120,147 @@ def redis_cache(
     return decorator
 
 
+async def _call_coalesced(
+    cache_key: str,
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+) -> tuple[Any, bool]:
+    """
+    Call func once per cache key for concurrent cache misses (singleflight).
+
+    The first caller runs func; callers arriving while it is in flight
+    await the same result (or exception) instead of hitting the backend.
+
+    Returns:
+        Tuple of (result, is_leader) - only the leader should write the cache
+    """
+    inflight = _inflight.get(cache_key)
+    if inflight is not None:
+        try:
+            return await asyncio.shield(inflight), False
+        except asyncio.CancelledError:
+            if not inflight.cancelled():
+                raise
+            # Leader was cancelled - fetch on our own
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = future
+    try:
+        result = await func(*args, **kwargs)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        # Mark as retrieved so an unawaited future doesn't log a warning
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+    finally:
+        if _inflight.get(cache_key) is future:
+            del _inflight[cache_key]
+
+    return result, True
+
+
+def _inspect_params(func: Callable) -> tuple[tuple[str, ...], dict[str, Any]]:
+    """
+    Extract positional parameter names and defaults from function signature.
+
+    Returns:
+        Tuple of (positional parameter names, {name: default})
+    """
+    sig = inspect.signature(func)
+    positional_kinds = (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    )
+    param_names = tuple(
+        name for name, p in sig.parameters.items() if p.kind in positional_kinds
+    )
+    defaults = {
+        name: p.default
+        for name, p in sig.parameters.items()
+        if p.default is not inspect.Parameter.empty
+    }
+    return param_names, defaults
+
+
+def _compile_positional_key(
+    key_pattern: str,
+    prefix: str,
+    param_names: tuple[str, ...],
+    defaults: dict[str, Any],
+) -> Optional[Callable[[tuple], Optional[str]]]:
+    """
+    Compile key pattern into a builder for positional-only calls.
+
+    "camera:mac:{mac_address}" with params (mac_address,) becomes
+    "cache:camera:mac:{0}" formatted straight from the args tuple, so the
+    common call style skips building an arguments dict.
+
+    Returns:
+        Builder returning the key (or None if an argument is missing),
+        or None if the pattern references names that aren't positional params
+    """
+    positions = {name: i for i, name in enumerate(param_names)}
+    template_parts = [prefix.replace("{", "{{").replace("}", "}}"), ":"]
+    slots: list[tuple[int, str]] = []  # (param position, param name) per template field
+
+    try:
+        parsed = list(string.Formatter().parse(key_pattern))
+    except ValueError:
+        return None
+
+    for literal, field_name, format_spec, conversion in parsed:
+        template_parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+        # Split "user.id" / "items[0]" into base name and accessor suffix
+        base = field_name
+        for i, ch in enumerate(field_name):
+            if ch in ".[":
+                base = field_name[:i]
+                break
+        if base not in positions:
+            return None
+        template_parts.append(f"{{{len(slots)}{field_name[len(base):]}")
+        if conversion:
+            template_parts.append(f"!{conversion}")
+        if format_spec:
+            template_parts.append(f":{format_spec}")
+        template_parts.append("}")
+        slots.append((positions[base], base))
+
+    template = "".join(template_parts)
+    missing = object()
+    slot_defaults = tuple(defaults.get(name, missing) for _, name in slots)
+
+    def build(args: tuple) -> Optional[str]:
+        n = len(args)
+        values = []
+        for (pos, _), default in zip(slots, slot_defaults):
+            if pos < n:
+                values.append(args[pos])
+            elif default is not missing:
+                values.append(default)
+            else:
+                return None
+        return template.format(*values)
+
+    return build
+
+
 def _build_cache_key(
     key_pattern: str,
     prefix: str,
     func: Callable,
     args: tuple,
-    kwargs: dict
+    kwargs: dict,
+    param_names: tuple[str, ...],
+    defaults: dict[str, Any],
 ) -> str:
     """
     Build cache key from pattern and function arguments.
@@ -113,15 +270,14 @@ def _build_cache_key(
     - "user:{user_id}:settings"
     - "complex:{complex_id}:cameras"
     """
-    # Get function signature
-    import inspect
-    sig = inspect.signature(func)
-    bound_args = sig.bind(*args, **kwargs)
-    bound_args.apply_defaults()
+    # Map arguments to parameter names (defaults < positional < keyword)
+    arguments = dict(defaults)
+    arguments.update(zip(param_names, args))
+    arguments.update(kwargs)
 
     # Format key with arguments
     try:
-        formatted_key = key_pattern.format(**bound_args.arguments)
+        formatted_key = key_pattern.format_map(arguments)
     except KeyError as e:
         logger.error(f"Missing argument for cache key pattern {key_pattern}: {e}")
         # Fallback to function name + args hash
@@ -141,26 +297,34 @@ def _setup_cache_invalidation(
     Setup automatic cache invalidation on Pub/Sub events.
 
     When event is received, extracts keys from event data and invalidates cache.
+    Handlers are registered on the global subscriber, so they run once
+    get_global_subscriber().start() is called at startup.
     """
-    subscriber = RedisSubscriber()
+    subscriber = get_global_subscriber()
 
     for channel in channels:
-        async def invalidation_handler(data: dict):
-            """Handler for cache invalidation events"""
-            try:
-                # Try to build cache key from event data
-                cache_key = f"{prefix}:{key_pattern.format(**data)}"
-                client = get_redis_client()
-                deleted = await client.delete(cache_key)
-                if deleted:
-                    logger.info(f"Cache invalidated: {cache_key} (event: {channel})")
-            except KeyError:
-                # Event data doesn't match key pattern
-                logger.debug(f"Could not invalidate cache for {key_pattern} from event {channel}")
-            except Exception as e:
-                logger.error(f"Cache invalidation error: {e}", exc_info=True)
+        subscriber.subscribe(channel, _make_invalidation_handler(channel, key_pattern, prefix))
+
 
-        subscriber.subscribe(channel, invalidation_handler)
+def _make_invalidation_handler(channel: str, key_pattern: str, prefix: str) -> Callable:
+    """Create invalidation handler bound to a single channel and key pattern."""
+
+    async def invalidation_handler(data: dict):
+        """Handler for cache invalidation events"""
+        try:
+            # Try to build cache key from event data
+            cache_key = f"{prefix}:{key_pattern.format(**data)}"
+            client = get_redis_client()
+            deleted = await client.delete(cache_key)
+            if deleted:
+                logger.info(f"Cache invalidated: {cache_key} (event: {channel})")
+        except KeyError:
+            # Event data doesn't match key pattern
+            logger.debug(f"Could not invalidate cache for {key_pattern} from event {channel}")
+        except Exception as e:
+            logger.error(f"Cache invalidation error: {e}", exc_info=True)
+
+    return invalidation_handler
 
 
 class CacheManager:
@@ -176,6 +340,10 @@ class CacheManager:
         # Get
         data = await cache.get("camera:mac:AA:BB:CC")
 
+        # Batch get/set (one round-trip)
+        found = await cache.get_many(["camera:mac:AA:BB:CC", "camera:mac:DD:EE:FF"])
+        await cache.set_many({"camera:mac:DD:EE:FF": {"id": 124}}, ttl=3600)
+
         # Invalidate
         await cache.invalidate("camera:mac:AA:BB:CC")
 
@@ -202,9 +370,9 @@ class CacheManager:
         """Get value from cache"""
         full_key = self._make_key(key)
         try:
-            data = await self.client.get(full_key)
+            data = await self.client.raw.get(full_key)
             if data:
-                return json.loads(data)
+                return json_loads(data)
         except Exception as e:
             logger.error(f"Cache get error for {full_key}: {e}")
         return None
@@ -213,7 +381,7 @@ class CacheManager:
         """Set value in cache"""
         full_key = self._make_key(key)
         try:
-            payload = json.dumps(value, ensure_ascii=False, default=str)
+            payload = json_dumps(value)
             await self.client.set(full_key, payload, ex=ttl)
             logger.debug(f"Cached {full_key} (TTL: {ttl}s)")
             return True
@@ -221,6 +389,59 @@ class CacheManager:
             logger.error(f"Cache set error for {full_key}: {e}")
             return False
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Get multiple values from cache in one round-trip.
+
+        Args:
+            keys: Keys (without prefix)
+
+        Returns:
+            Dict of key -> value for cache hits only
+        """
+        if not keys:
+            return {}
+        try:
+            values = await self.client.raw.mget(*[self._make_key(k) for k in keys])
+        except Exception as e:
+            logger.error(f"Cache get_many error for {len(keys)} keys: {e}")
+            return {}
+
+        result: dict[str, Any] = {}
+        for key, data in zip(keys, values):
+            if data:
+                try:
+                    result[key] = json_loads(data)
+                except Exception as e:
+                    logger.error(f"Cache decode error for {self._make_key(key)}: {e}")
+        return result
+
+    async def set_many(self, items: dict[str, Any], ttl: int = 3600) -> bool:
+        """
+        Set multiple values in cache in one round-trip.
+
+        Uses a pipeline of SET ... EX (MSET has no per-key TTL).
+
+        Args:
+            items: Dict of key (without prefix) -> value
+            ttl: Time to live in seconds
+
+        Returns:
+            True if successful
+        """
+        if not items:
+            return True
+        try:
+            async with self.client.redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(self._make_key(key), json_dumps(value), ex=ttl)
+                await pipe.execute()
+            logger.debug(f"Cached {len(items)} keys with prefix {self.prefix} (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            logger.error(f"Cache set_many error for {len(items)} keys: {e}")
+            return False
+
     async def invalidate(self, key: str) -> bool:
         """Invalidate (delete) cache key"""
         full_key = self._make_key(key)
@@ -238,6 +459,7 @@ class CacheManager:
         Invalidate all keys matching pattern.
 
         Warning: This uses SCAN which can be slow on large datasets.
+        Matching keys are removed in batches with UNLINK.
 
         Args:
             pattern: Key pattern (e.g., "camera:mac:*")
@@ -248,9 +470,16 @@ class CacheManager:
         full_pattern = self._make_key(pattern)
         try:
             count = 0
-            async for key in self.client.redis.scan_iter(match=full_pattern):
-                await self.client.delete(key)
-                count += 1
+            batch: list = []
+            async for key in self.client.redis.scan_iter(
+                match=full_pattern, count=INVALIDATE_BATCH_SIZE
+            ):
+                batch.append(key)
+                if len(batch) >= INVALIDATE_BATCH_SIZE:
+                    count += await self.client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                count += await self.client.unlink(*batch)
             logger.info(f"Invalidated {count} keys matching {full_pattern}")
             return count
         except Exception as e:
@@ -7,6 +7,7 @@ Provides singleton Redis connection for pub/sub, caching, and RPC.
 from __future__ import annotations
 
 import logging
+import socket
 from typing import Optional
 
 import redis.asyncio as aioredis
@@ -14,62 +15,87 @@ import redis.asyncio as aioredis
 logger = logging.getLogger(__name__)
 
 
+def _keepalive_options() -> dict[int, int]:
+    """
+    TCP keepalive tuning: detect dead connections in ~90s instead of the
+    kernel default (~2h). Only options the platform supports are set.
+    """
+    options = {}
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+        if hasattr(socket, name):
+            options[getattr(socket, name)] = value
+    return options
+
+
 class RedisClient:
     """
-    Singleton Redis client for messaging operations.
+    Redis client for messaging operations.
+
+    The process-wide instance is managed by get_redis_client()/init_redis().
 
     Usage:
-        client = RedisClient.get_instance("redis://redis:6379")
+        client = get_redis_client("redis://redis:6379")
         await client.connect()
 
         # Publish
         await client.publish("channel", "message")
 
-        # Get/Set
+        # Get/Set (str values; client.raw returns bytes)
         await client.set("key", "value", ex=3600)
         value = await client.get("key")
     """
 
-    _instance: Optional[RedisClient] = None
-    _redis: Optional[aioredis.Redis] = None
-
-    def __init__(self, redis_url: str):
+    def __init__(
+        self,
+        redis_url: str,
+        connect_timeout: Optional[float] = 5.0,
+        max_connections: Optional[int] = None,
+    ):
         """
         Initialize Redis client.
 
         Args:
             redis_url: Redis connection URL
+            connect_timeout: Seconds to wait for a new connection (None = no limit)
+            max_connections: Connection pool size limit (None = redis-py default)
         """
         self.redis_url = redis_url
+        self.connect_timeout = connect_timeout
+        self.max_connections = max_connections
+        self._redis: Optional[aioredis.Redis] = None
+        self._raw: Optional[aioredis.Redis] = None
         self._connected = False
 
-    @classmethod
-    def get_instance(cls, redis_url: Optional[str] = None) -> RedisClient:
-        """
-        Get singleton instance of Redis client.
-
-        Args:
-            redis_url: Redis URL (required on first call)
-
-        Returns:
-            RedisClient instance
-        """
-        if cls._instance is None:
-            if redis_url is None:
-                raise ValueError("redis_url is required on first call to get_instance")
-            cls._instance = cls(redis_url)
-        return cls._instance
-
     async def connect(self):
         """Connect to Redis"""
         if self._connected:
             return
 
         logger.info(f"Connecting to Redis: {self.redis_url}")
+        # asyncio already sets TCP_NODELAY on TCP transports; keepalive lets
+        # idle pub/sub connections notice a dead peer.
+        # Commands are served from a connection pool, so concurrent publishes
+        # run on separate connections (and Redis 6+ I/O threads) in parallel.
+        options = {
+            "socket_connect_timeout": self.connect_timeout,
+            "socket_keepalive": True,
+            "socket_keepalive_options": _keepalive_options(),
+        }
+        if self.max_connections is not None:
+            options["max_connections"] = self.max_connections
         self._redis = await aioredis.from_url(
             self.redis_url,
             encoding="utf-8",
-            decode_responses=True
+            decode_responses=True,
+            **options,
+        )
+        # Second pool without decoding, for the cache layer and the pub/sub
+        # subscriber: payloads go straight to the JSON/MessagePack decoder
+        # without a str round-trip (the public helpers above keep str)
+        self._raw = await aioredis.from_url(
+            self.redis_url,
+            decode_responses=False,
+            **options,
         )
         self._connected = True
         logger.info("Redis client connected")
@@ -78,6 +104,8 @@ class RedisClient:
         """Disconnect from Redis"""
         if self._redis:
             await self._redis.close()
+            if self._raw:
+                await self._raw.close()
             self._connected = False
             logger.info("Redis client disconnected")
 
@@ -88,13 +116,20 @@ class RedisClient:
             raise RuntimeError("Redis client not connected. Call await client.connect() first.")
         return self._redis
 
+    @property
+    def raw(self) -> aioredis.Redis:
+        """Get Redis connection that returns raw bytes (no response decoding)"""
+        if not self._connected or not self._raw:
+            raise RuntimeError("Redis client not connected. Call await client.connect() first.")
+        return self._raw
+
     # === Key-Value operations ===
 
     async def get(self, key: str) -> Optional[str]:
         """Get value by key"""
         return await self.redis.get(key)
 
-    async def set(self, key: str, value: str, ex: Optional[int] = None) -> bool:
+    async def set(self, key: str, value: str | bytes, ex: Optional[int] = None) -> bool:
         """
         Set key-value pair.
 
@@ -108,10 +143,27 @@ class RedisClient:
         """
         return await self.redis.set(key, value, ex=ex)
 
+    async def mget(self, *keys: str) -> list[Optional[str]]:
+        """Get values for multiple keys in one round-trip (None for missing)"""
+        return await self.redis.mget(*keys)
+
+    async def mset(self, mapping: dict[str, str | bytes]) -> bool:
+        """Set multiple key-value pairs in one round-trip (no TTL)"""
+        return await self.redis.mset(mapping)
+
     async def delete(self, *keys: str) -> int:
         """Delete one or more keys. Returns number of keys deleted."""
         return await self.redis.delete(*keys)
 
+    async def unlink(self, *keys: str) -> int:
+        """
+        Delete one or more keys, reclaiming memory in the background.
+
+        Non-blocking alternative to delete() for large batches.
+        Returns number of keys removed.
+        """
+        return await self.redis.unlink(*keys)
+
     async def exists(self, *keys: str) -> int:
         """Check if keys exist. Returns number of existing keys."""
         return await self.redis.exists(*keys)
@@ -158,16 +210,17 @@ class RedisClient:
         return await self.redis.hdel(name, *keys)
 
 
-# Global instance accessor
+# The single process-wide client (see get_redis_client)
 _global_client: Optional[RedisClient] = None
 
 
-def get_redis_client(redis_url: Optional[str] = None) -> RedisClient:
+def get_redis_client(redis_url: Optional[str] = None, max_connections: Optional[int] = None) -> RedisClient:
     """
     Get global Redis client instance.
 
     Args:
         redis_url: Redis URL (required on first call)
+        max_connections: Connection pool size limit (used on first call only)
 
     Returns:
         RedisClient instance
@@ -176,11 +229,11 @@ def get_redis_client(redis_url: Optional[str] = None) -> RedisClient:
     if _global_client is None:
         if redis_url is None:
             raise ValueError("redis_url is required on first call")
-        _global_client = RedisClient(redis_url)
+        _global_client = RedisClient(redis_url, max_connections=max_connections)
     return _global_client
 
 
-async def init_redis(redis_url: str):
+async def init_redis(redis_url: str, max_connections: Optional[int] = None):
     """
     Initialize global Redis client.
 
@@ -188,8 +241,9 @@ async def init_redis(redis_url: str):
 
     Args:
         redis_url: Redis connection URL
+        max_connections: Connection pool size limit (None = redis-py default)
     """
-    client = get_redis_client(redis_url)
+    client = get_redis_client(redis_url, max_connections=max_connections)
     await client.connect()
     logger.info("Redis messaging initialized")
 
@@ -200,3 +254,7 @@ async def close_redis():
     if _global_client:
         await _global_client.disconnect()
         _global_client = None
+
+    # The shared publisher holds the old client - rebuilt on next publish
+    from .pubsub import reset_publisher
+    reset_publisher()
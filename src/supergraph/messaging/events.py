@@ -6,9 +6,13 @@ EventConfig для автоматической публикации событ
 
 from __future__ import annotations
 
+import functools
 import logging
+import operator
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from .pubsub import RedisPublisher, get_publisher, redis_publish
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +48,10 @@ class EventConfig:
     # Whether to publish on batch operations
     publish_batch: bool = False
 
+    def __post_init__(self):
+        """Freeze payload field names (hashable key for the compiled getter)"""
+        self._field_names: tuple[str, ...] = tuple(self.payload_fields or ())
+
     def get_channel(self, operation: str) -> Optional[str]:
         """Get channel name for operation"""
         return self.publish.get(operation)
@@ -67,28 +75,88 @@ class EventConfig:
             return self.payload_builder(instance, operation)
 
         # Default payload builder
-        payload = {"operation": operation}
-
-        if self.payload_fields:
-            # Extract specified fields
-            for field in self.payload_fields:
-                if hasattr(instance, field):
-                    value = getattr(instance, field)
-                    # Handle nested objects
-                    if hasattr(value, "__dict__"):
-                        payload[field] = {k: v for k, v in value.__dict__.items() if not k.startswith("_")}
-                    else:
-                        payload[field] = value
-        else:
-            # Extract all non-private fields
-            if hasattr(instance, "__dict__"):
-                payload.update({
-                    k: v for k, v in instance.__dict__.items()
-                    if not k.startswith("_")
-                })
+        return _extract_payload({"operation": operation}, instance, self._field_names, flatten=True)
+
 
+@functools.lru_cache(maxsize=1024)
+def _compile_getter(fields: tuple[str, ...]) -> Callable:
+    """Build (once per field set) a getter returning all fields in one call"""
+    return operator.attrgetter(*fields)
+
+
+def _extract_payload(
+    payload: dict,
+    instance: Any,
+    fields: Optional[Sequence[str]],
+    flatten: bool = False,
+) -> dict:
+    """
+    Fill payload with event fields from instance (in one pass, no temporary dict).
+
+    Args:
+        payload: Dict to fill
+        instance: Model instance
+        fields: Fields to include (all non-private attributes if empty)
+        flatten: Convert nested objects to dicts of their public attributes
+
+    Returns:
+        The filled payload (missing fields are skipped)
+    """
+    if not fields:
+        if hasattr(instance, "__dict__"):
+            payload.update(_public_fields(instance.__dict__))
         return payload
 
+    fields = tuple(fields)
+    try:
+        values = _compile_getter(fields)(instance)
+    except AttributeError:
+        # Some fields are missing - take the ones that exist
+        pairs = [(name, getattr(instance, name)) for name in fields if hasattr(instance, name)]
+    else:
+        pairs = zip(fields, (values,) if len(fields) == 1 else values)
+
+    if flatten:
+        payload.update((name, _flatten(value)) for name, value in pairs)
+    else:
+        payload.update(pairs)
+    return payload
+
+
+def _public_fields(attrs: dict) -> Iterator[tuple[str, Any]]:
+    """Iterate (name, value) pairs of non-private attributes"""
+    return ((k, v) for k, v in attrs.items() if k[:1] != "_")
+
+
+def _flatten(value: Any) -> Any:
+    """Convert nested objects to a dict of their public attributes"""
+    if hasattr(value, "__dict__"):
+        return dict(_public_fields(value.__dict__))
+    return value
+
+
+def _skip_unsubscribed(
+    channel: str, redis_url: Optional[str]
+) -> tuple[bool, Optional[RedisPublisher]]:
+    """
+    Check whether publishing to channel can be skipped (nobody listening).
+
+    Only possible with RedisPublisher.no_subscriber_ttl enabled (class-level
+    setting); the publisher looked up for the check is returned for reuse.
+
+    Returns:
+        (skip, publisher or None)
+    """
+    if RedisPublisher.no_subscriber_ttl <= 0:
+        return False, None
+    try:
+        publisher = get_publisher(redis_url)
+    except Exception as e:
+        # Not fatal here - the publish attempt reports the error
+        logger.debug("Subscriber check for %s failed: %s", channel, e)
+        return False, None
+    return not publisher.has_subscribers(channel), publisher
+
 
 async def publish_model_event(
     event_config: EventConfig,
@@ -112,20 +180,70 @@ async def publish_model_event(
     if not channel:
         return
 
+    # Nobody listening - skip building and encoding the payload
+    skip, publisher = _skip_unsubscribed(channel, redis_url)
+    if skip:
+        return
+
     # Build payload
     try:
         payload = event_config.build_payload(instance, operation)
     except Exception as e:
-        logger.error(f"Failed to build event payload: {e}", exc_info=True)
+        logger.error("Failed to build event payload: %s", e, exc_info=True)
+        return
+
+    # Publish
+    try:
+        publisher = publisher or get_publisher(redis_url)
+        count = await publisher.publish(channel, payload)
+        logger.info("Published %s event to %s: %s subscribers", operation, channel, count)
+    except Exception as e:
+        logger.error("Failed to publish event to %s: %s", channel, e, exc_info=True)
+
+
+async def publish_model_events(
+    event_config: EventConfig,
+    operation: str,
+    instances: list[Any],
+    redis_url: Optional[str] = None
+):
+    """
+    Publish events for a batch operation in one Redis round-trip.
+
+    Does nothing unless event_config.publish_batch is enabled.
+
+    Args:
+        event_config: Event configuration
+        operation: Operation type (create/update/delete)
+        instances: Model instances affected by the operation
+        redis_url: Redis URL (optional)
+    """
+    if not event_config.publish_batch or not instances:
+        return
+
+    channel = event_config.get_channel(operation)
+    if not channel:
+        return
+
+    # Nobody listening - skip building and encoding the payloads
+    skip, publisher = _skip_unsubscribed(channel, redis_url)
+    if skip:
+        return
+
+    # Build payloads
+    try:
+        items = [(channel, event_config.build_payload(instance, operation)) for instance in instances]
+    except Exception as e:
+        logger.error("Failed to build event payloads: %s", e, exc_info=True)
         return
 
     # Publish
     try:
-        from .pubsub import redis_publish
-        count = await redis_publish(channel, payload, redis_url)
-        logger.info(f"Published {operation} event to {channel}: {count} subscribers")
+        publisher = publisher or get_publisher(redis_url)
+        await publisher.publish_many(items)
+        logger.info("Published %s %s events to %s", len(items), operation, channel)
     except Exception as e:
-        logger.error(f"Failed to publish event to {channel}: {e}", exc_info=True)
+        logger.error("Failed to publish events to %s: %s", channel, e, exc_info=True)
 
 
 # Helper for setting up event handlers in services
@@ -186,22 +304,13 @@ class EventPublisher:
         if isinstance(instance, dict):
             payload = instance
         else:
-            payload = {}
-            if fields:
-                for field in fields:
-                    if hasattr(instance, field):
-                        payload[field] = getattr(instance, field)
-            else:
-                # All fields
-                if hasattr(instance, "__dict__"):
-                    payload = {k: v for k, v in instance.__dict__.items() if not k.startswith("_")}
+            payload = _extract_payload({}, instance, fields)
 
         payload["operation"] = operation
 
         # Publish
         try:
-            from .pubsub import redis_publish
             count = await redis_publish(channel, payload, self.redis_url)
-            logger.info(f"Published {self.entity_name}.{operation}: {count} subscribers")
+            logger.info("Published %s.%s: %s subscribers", self.entity_name, operation, count)
         except Exception as e:
-            logger.error(f"Failed to publish {channel}: {e}", exc_info=True)
+            logger.error("Failed to publish %s: %s", channel, e, exc_info=True)
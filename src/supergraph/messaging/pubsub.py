@@ -8,14 +8,43 @@ Subscriber - подписывается и обрабатывает событи
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
+import inspect
 import logging
+import time
 from typing import Any, Callable, Dict, Optional
 
+from ..core.serialization import (
+    HAS_MSGPACK,
+    is_msgpack_map,
+    json_dumps,
+    json_loads,
+    msgpack_dumps,
+    msgpack_loads,
+)
 from .client import get_redis_client
 
 logger = logging.getLogger(__name__)
 
+# Max messages handled per listener wake-up before yielding to the event loop
+MAX_DRAIN_BATCH = 256
+
+# Last observed subscriber count per channel: channel -> (monotonic time, count)
+_subscriber_counts: Dict[str, tuple[float, int]] = {}
+
+
+def _is_async_callable(func: Callable) -> bool:
+    """
+    Check if calling func returns an awaitable.
+
+    Also detects functools.partial of coroutine functions and objects with
+    an async __call__, which inspect.iscoroutinefunction misses.
+    """
+    while isinstance(func, functools.partial):
+        func = func.func
+    # Look __call__ up on the type, as calling the object does
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(type(func).__call__)
+
 
 class RedisPublisher:
     """
@@ -29,16 +58,62 @@ class RedisPublisher:
             "camera.updated",
             {"id": 123, "mac_address": "AA:BB:CC:DD:EE:FF"}
         )
+
+    Skipping unobserved channels:
+        Set no_subscriber_ttl > 0 (per instance or on the class at startup)
+        to skip publishing for that many seconds after a publish reached
+        zero subscribers. Subscribers joining inside that window miss
+        events, so this is off by default.
+
+        RedisPublisher.no_subscriber_ttl = 2.0
+
+    Wire format:
+        serializer="msgpack" sends MessagePack instead of JSON (smaller and
+        faster to encode). RedisSubscriber detects the format per message, so
+        only use it on channels whose consumers are RedisSubscribers - not
+        browsers or other JSON-only clients.
     """
 
-    def __init__(self, redis_url: Optional[str] = None):
+    # Seconds to trust a zero subscriber count (0 = always publish)
+    no_subscriber_ttl: float = 0.0
+
+    # Payload encoding: "json" or "msgpack"
+    serializer: str = "json"
+
+    def __init__(self, redis_url: Optional[str] = None, serializer: Optional[str] = None):
         """
         Initialize publisher.
 
         Args:
             redis_url: Redis URL (optional if already initialized)
+            serializer: "json" or "msgpack" (defaults to RedisPublisher.serializer)
         """
         self.client = get_redis_client(redis_url)
+        if serializer is not None:
+            self.serializer = serializer
+        if self.serializer == "msgpack":
+            if not HAS_MSGPACK:
+                raise ImportError("msgpack is required for serializer='msgpack' (pip install supergraph[msgpack])")
+            self._encode = msgpack_dumps
+        elif self.serializer == "json":
+            self._encode = json_dumps
+        else:
+            raise ValueError(f"Unknown serializer: {self.serializer!r} (expected 'json' or 'msgpack')")
+
+    def has_subscribers(self, channel: str) -> bool:
+        """
+        Check whether publishing to channel may reach anyone.
+
+        Returns False only if a recent publish (within no_subscriber_ttl)
+        reached zero subscribers.
+        """
+        if self.no_subscriber_ttl <= 0:
+            return True
+        observed = _subscriber_counts.get(channel)
+        if observed is None:
+            return True
+        observed_at, count = observed
+        return count > 0 or time.monotonic() - observed_at > self.no_subscriber_ttl
 
     async def publish(self, channel: str, data: Dict[str, Any]) -> int:
         """
@@ -46,20 +121,47 @@ class RedisPublisher:
 
         Args:
             channel: Channel name (e.g., "camera.updated")
-            data: Event data (will be JSON serialized)
+            data: Event data (serialized with the publisher's serializer)
 
         Returns:
             Number of subscribers that received the message
         """
+        if not self.has_subscribers(channel):
+            return 0
         try:
-            payload = json.dumps(data, ensure_ascii=False)
+            payload = self._encode(data)
             count = await self.client.publish(channel, payload)
-            logger.debug(f"Published to {channel}: {count} subscribers received")
+            if self.no_subscriber_ttl > 0:
+                _subscriber_counts[channel] = (time.monotonic(), count)
+            logger.debug("Published to %s: %s subscribers received", channel, count)
             return count
         except Exception as e:
-            logger.error(f"Failed to publish to {channel}: {e}", exc_info=True)
+            logger.error("Failed to publish to %s: %s", channel, e, exc_info=True)
             return 0
 
+    async def publish_many(self, items: list[tuple[str, Dict[str, Any]]]) -> list[int]:
+        """
+        Publish several events in one Redis round-trip (pipelined).
+
+        Args:
+            items: List of (channel, data) pairs, published in order
+
+        Returns:
+            Number of subscribers that received each message
+        """
+        if not items:
+            return []
+        try:
+            async with self.client.redis.pipeline(transaction=False) as pipe:
+                for channel, data in items:
+                    pipe.publish(channel, self._encode(data))
+                counts = await pipe.execute()
+            logger.debug("Published %s messages in one pipeline", len(items))
+            return counts
+        except Exception as e:
+            logger.error("Failed to publish batch of %s messages: %s", len(items), e, exc_info=True)
+            return [0] * len(items)
+
     async def publish_raw(self, channel: str, message: str) -> int:
         """
         Publish raw string message to channel.
@@ -73,10 +175,10 @@ class RedisPublisher:
         """
         try:
             count = await self.client.publish(channel, message)
-            logger.debug(f"Published raw to {channel}: {count} subscribers")
+            logger.debug("Published raw to %s: %s subscribers", channel, count)
             return count
         except Exception as e:
-            logger.error(f"Failed to publish raw to {channel}: {e}", exc_info=True)
+            logger.error("Failed to publish raw to %s: %s", channel, e, exc_info=True)
             return 0
 
 
@@ -95,15 +197,20 @@ class RedisSubscriber:
         await subscriber.start()
     """
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(self, redis_url: Optional[str] = None, max_concurrency: int = 64):
         """
         Initialize subscriber.
 
         Args:
             redis_url: Redis URL (optional if already initialized)
+            max_concurrency: Max messages being handled at the same time
         """
         self.client = get_redis_client(redis_url)
-        self._handlers: Dict[str, list[Callable]] = {}
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None  # created in start() (inside the loop)
+        self._tasks: set[asyncio.Task] = set()
+        # channel -> [(handler, is_coroutine_function)]
+        self._handlers: Dict[str, list[tuple[Callable, bool]]] = {}
         self._pubsub = None
         self._listener_task: Optional[asyncio.Task] = None
         self._running = False
@@ -118,10 +225,8 @@ class RedisSubscriber:
                 pass
         """
         def decorator(func: Callable):
-            if channel not in self._handlers:
-                self._handlers[channel] = []
-            self._handlers[channel].append(func)
-            logger.info(f"Registered handler for channel: {channel}")
+            self._add_handler(channel, func)
+            logger.info("Registered handler for channel: %s", channel)
             return func
         return decorator
 
@@ -133,10 +238,12 @@ class RedisSubscriber:
             channel: Channel name
             handler: Async function to handle messages
         """
-        if channel not in self._handlers:
-            self._handlers[channel] = []
-        self._handlers[channel].append(handler)
-        logger.info(f"Subscribed to channel: {channel}")
+        self._add_handler(channel, handler)
+        logger.info("Subscribed to channel: %s", channel)
+
+    def _add_handler(self, channel: str, handler: Callable):
+        """Register handler, resolving sync vs async once instead of per message"""
+        self._handlers.setdefault(channel, []).append((handler, _is_async_callable(handler)))
 
     async def start(self):
         """Start listening for messages"""
@@ -151,15 +258,16 @@ class RedisSubscriber:
         # Connect to Redis if not connected
         await self.client.connect()
 
-        # Create pubsub instance
-        self._pubsub = self.client.pubsub()
+        # Create pubsub instance (bytes mode: MessagePack payloads stay binary)
+        self._pubsub = self.client.raw.pubsub()
 
         # Subscribe to all channels
         channels = list(self._handlers.keys())
         await self._pubsub.subscribe(*channels)
-        logger.info(f"Subscribed to Redis channels: {channels}")
+        logger.info("Subscribed to Redis channels: %s", channels)
 
         # Start listener task
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
         self._running = True
         self._listener_task = asyncio.create_task(self._listen())
         logger.info("Redis subscriber started")
@@ -175,6 +283,10 @@ class RedisSubscriber:
             except asyncio.CancelledError:
                 pass
 
+        # Let in-flight handlers finish
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
         if self._pubsub:
             await self._pubsub.close()
 
@@ -186,53 +298,123 @@ class RedisSubscriber:
         try:
             while self._running:
                 try:
+                    # Block until something arrives...
                     message = await self._pubsub.get_message(
                         ignore_subscribe_messages=True,
                         timeout=1.0
                     )
 
-                    if message and message["type"] == "message":
-                        channel = message["channel"]
-                        data = message["data"]
-                        await self._handle_message(channel, data)
+                    # ...then drain whatever is already buffered without waiting
+                    drained = 0
+                    while message is not None:
+                        if message["type"] == "message":
+                            channel = message["channel"]
+                            if isinstance(channel, bytes):
+                                channel = channel.decode()
+                            await self._dispatch(channel, message["data"])
+
+                        drained += 1
+                        if drained >= MAX_DRAIN_BATCH or not self._running:
+                            break
+                        message = await self._pubsub.get_message(
+                            ignore_subscribe_messages=True,
+                            timeout=0.0
+                        )
 
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
-                    logger.error(f"Redis listener error: {e}", exc_info=True)
+                    logger.error("Redis listener error: %s", e, exc_info=True)
                     await asyncio.sleep(1)
 
         except asyncio.CancelledError:
             logger.info("Redis listener cancelled")
 
-    async def _handle_message(self, channel: str, raw_data: str):
+    async def _dispatch(self, channel: str, raw_data: str | bytes):
+        """
+        Handle message in a background task so slow handlers don't block intake.
+
+        Waits for a free slot when max_concurrency messages are in flight.
+        Messages may therefore complete out of order.
+        """
+        await self._semaphore.acquire()
+        task = asyncio.create_task(self._handle_message(channel, raw_data))
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task: asyncio.Task):
+        """Release concurrency slot of a finished handler task"""
+        self._tasks.discard(task)
+        self._semaphore.release()
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Redis message handling failed: %s", task.exception())
+
+    async def _handle_message(self, channel: str, raw_data: str | bytes):
         """Handle incoming message"""
-        handlers = self._handlers.get(channel, [])
+        handlers = self._handlers.get(channel)
         if not handlers:
             return
 
-        # Parse JSON
+        # Parse payload (MessagePack or JSON)
         try:
-            data = json.loads(raw_data) if isinstance(raw_data, str) else raw_data
-        except json.JSONDecodeError:
-            logger.warning(f"Invalid JSON in message from {channel}: {raw_data[:100]}")
+            if is_msgpack_map(raw_data):
+                data = msgpack_loads(raw_data)
+            elif isinstance(raw_data, (str, bytes)):
+                data = json_loads(raw_data)
+            else:
+                data = raw_data
+        except (ValueError, ImportError) as e:
+            logger.warning("Invalid payload in message from %s: %s (%s)", channel, raw_data[:100], e)
             return
 
-        logger.debug(f"Received message on {channel}: {data}")
+        logger.debug("Received message on %s: %s", channel, data)
 
-        # Call all handlers
-        for handler in handlers:
-            try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(data)
-                else:
-                    handler(data)
-            except Exception as e:
-                logger.error(f"Error in handler for {channel}: {e}", exc_info=True)
+        # Call all handlers (async handlers of one message run concurrently)
+        if len(handlers) == 1:
+            await self._run_handler(channel, *handlers[0], data)
+        else:
+            await asyncio.gather(
+                *(self._run_handler(channel, handler, is_coro, data) for handler, is_coro in handlers)
+            )
+
+    async def _run_handler(self, channel: str, handler: Callable, is_coro: bool, data: Any):
+        """Run one handler, logging (not propagating) its errors"""
+        try:
+            if is_coro:
+                await handler(data)
+            else:
+                handler(data)
+        except Exception as e:
+            logger.error("Error in handler for %s: %s", channel, e, exc_info=True)
 
 
 # Helper functions
 
+# Shared publisher for redis_publish (see get_publisher)
+_publisher: Optional[RedisPublisher] = None
+
+
+def get_publisher(redis_url: Optional[str] = None) -> RedisPublisher:
+    """
+    Get the shared publisher.
+
+    Every publisher uses the process-wide client (get_redis_client ignores
+    redis_url once it exists), so one publisher serves all URLs. It is
+    created on first use and dropped by close_redis(), so the next publish
+    rebuilds it around the new client.
+    """
+    global _publisher
+    if _publisher is None:
+        _publisher = RedisPublisher(redis_url)
+    return _publisher
+
+
+def reset_publisher():
+    """Drop the shared publisher (called by close_redis when the client goes away)"""
+    global _publisher
+    _publisher = None
+
+
 async def redis_publish(channel: str, data: Dict[str, Any], redis_url: Optional[str] = None) -> int:
     """
     Publish event to Redis channel (convenience function).
@@ -245,8 +427,24 @@ async def redis_publish(channel: str, data: Dict[str, Any], redis_url: Optional[
     Returns:
         Number of subscribers
     """
-    publisher = RedisPublisher(redis_url)
-    return await publisher.publish(channel, data)
+    return await get_publisher(redis_url).publish(channel, data)
+
+
+async def redis_publish_many(
+    items: list[tuple[str, Dict[str, Any]]],
+    redis_url: Optional[str] = None,
+) -> list[int]:
+    """
+    Publish several events in one round-trip (convenience function).
+
+    Args:
+        items: List of (channel, data) pairs
+        redis_url: Redis URL (optional)
+
+    Returns:
+        Number of subscribers per message
+    """
+    return await get_publisher(redis_url).publish_many(items)
 
 
 def redis_subscribe(channel: str):
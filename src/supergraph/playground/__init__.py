@@ -16,11 +16,14 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 import os
+import re
 from pathlib import Path
+from typing import Optional
 
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 
@@ -29,6 +32,38 @@ from fastapi.staticfiles import StaticFiles
 _dist_override = os.environ.get("SUPERGRAPH_PLAYGROUND_DIST")
 DIST_PATH = Path(_dist_override) if _dist_override else Path(__file__).parent / "dist"
 
+# Vite output names in assets/: <name>-<8 char base64url content hash>.<ext>
+_HASHED_ASSET_PATTERN = re.compile(r"^[^/]+-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+
+# Directory Vite writes hashed build output to (files from public/ go to the root)
+_ASSETS_DIR_NAME = "assets"
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """
+    StaticFiles that marks content-hashed build assets as immutable.
+
+    Vite puts a content hash in every file it emits to assets/, so a given
+    URL never changes and browsers can cache it for a year without
+    revalidating. Only files directly in the built assets/ directory are
+    treated this way - a name merely ending in "-<8 chars>.<ext>" (such as
+    my-settings.js) elsewhere keeps the default caching.
+    """
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        full_path = Path(full_path)
+        if (
+            full_path.parent.name == _ASSETS_DIR_NAME
+            and _HASHED_ASSET_PATTERN.match(full_path.name)
+        ):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+# Everything get_playground_html rewrites, matched in a single pass
+_PLACEHOLDER_PATTERN = re.compile(r"</head>|=\"/assets/|='/assets/")
+
 
 def get_playground_html(
     *,
@@ -62,7 +97,7 @@ def get_playground_html(
 
     html = index_path.read_text()
 
-    # Inject configuration before </head>
+    # Configuration injected before </head>
     config_script = f"""
     <script>
         window.SUPERGRAPH_CONFIG = {{
@@ -71,13 +106,13 @@ def get_playground_html(
         }};
     </script>
 """
-    html = html.replace("</head>", f"{config_script}</head>")
-
-    # Fix asset paths if needed (Vite uses relative paths)
-    html = html.replace('="/assets/', f'="{assets_path}/')
-    html = html.replace("='/assets/", f"='{assets_path}/")
-
-    return html
+    replacements = {
+        "</head>": f"{config_script}</head>",
+        # Fix asset paths if needed (Vite uses relative paths)
+        '="/assets/': f'="{assets_path}/',
+        "='/assets/": f"='{assets_path}/",
+    }
+    return _PLACEHOLDER_PATTERN.sub(lambda m: replacements[m.group(0)], html)
 
 
 def mount_playground(
@@ -108,25 +143,41 @@ def mount_playground(
     assets_path = f"{path}/assets"
 
     # Serve static assets
-    dist_assets = DIST_PATH / "assets"
+    dist_assets = DIST_PATH / _ASSETS_DIR_NAME
     if dist_assets.exists() and dist_assets.is_dir():
         app.mount(
             assets_path,
-            StaticFiles(directory=str(dist_assets)),
+            ImmutableStaticFiles(directory=str(dist_assets)),
             name="supergraph_playground_assets",
         )
 
+    # Rendered page is fixed for this mount: render on first request, then
+    # serve the cached bytes. Browsers must revalidate on every load (the page
+    # references hashed assets that change on deploy); the ETag keeps that cheap
+    rendered: Optional[tuple[bytes, str]] = None
+
     @app.get(path, response_class=HTMLResponse, include_in_schema=False)
     @app.get(f"{path}/", response_class=HTMLResponse, include_in_schema=False)
-    async def playground_html():
+    async def playground_html(request: Request):
         """Supergraph Playground - Visual query builder."""
-        return get_playground_html(
-            api_url=api_url,
-            graph_url=graph_url,
-            assets_path=assets_path,
-        )
-
-    # Mount IAM Visualizer
+        nonlocal rendered
+        if rendered is None:
+            html_bytes = get_playground_html(
+                api_url=api_url,
+                graph_url=graph_url,
+                assets_path=assets_path,
+            ).encode("utf-8")
+            etag = f'"{hashlib.blake2b(html_bytes, digest_size=8).hexdigest()}"'
+            rendered = (html_bytes, etag)
+
+        html_bytes, etag = rendered
+        headers = {"Cache-Control": "no-cache", "ETag": etag}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(content=html_bytes, headers=headers)
+
+    # Mount IAM Visualizer (static file - FileResponse streams it from disk,
+    # using sendfile when the server supports it, instead of reading it per request)
     static_path = Path(__file__).parent / "static"
     if static_path.exists():
         @app.get(f"{path}/iam-visualizer.html", response_class=HTMLResponse, include_in_schema=False)
@@ -134,8 +185,8 @@ def mount_playground(
             """IAM Role Bindings Visualizer."""
             iam_html_path = static_path / "iam-visualizer.html"
             if iam_html_path.exists():
-                return iam_html_path.read_text()
-            return "<h1>IAM Visualizer not found</h1>"
+                return FileResponse(iam_html_path, media_type="text/html")
+            return HTMLResponse("<h1>IAM Visualizer not found</h1>")
 
 
 def is_bundled() -> bool:
@@ -10,9 +10,10 @@ Handles:
 
 from __future__ import annotations
 
-from typing import Any
+from collections import defaultdict
+from typing import Any, Optional
 
-from ..core.query_types import InternalQueryResponse, PaginationInfo
+from ..core.query_types import InternalQueryResponse
 from ..core.utils import convert_keys_to_camel
 from .planner import PlanStep
 
@@ -61,18 +62,21 @@ class ResponseAssembler:
         if not root_result:
             return {"data": None}
 
-        # CRITICAL: Convert ALL step results to mutable dicts ONCE
-        # This ensures we modify the same objects throughout assembly
-        mutable_results: dict[str, list[dict]] = {}
-        for step_id, result in results.items():
-            mutable_results[step_id] = [dict(item) for item in result.items]
+        # CRITICAL: All steps share the SAME item dicts throughout assembly,
+        # so relations attached to a child show up wherever it is nested.
+        # InternalQueryResponse validation already produced fresh dicts owned
+        # by this request, so they are modified in place without copying.
+        mutable_results: dict[str, list[dict]] = {
+            step_id: self._as_mutable(result.items) for step_id, result in results.items()
+        }
 
-        # Process child steps in reverse dependency order (deepest first)
-        child_steps = [s for s in steps if s.depends_on is not None]
-        child_steps = self._sort_by_depth(child_steps, step_map)
+        # child → parent maps of link steps, shared by two-hop relations
+        # that go through the same link step (request-scoped)
+        link_cache: dict[tuple, dict[Any, Any]] = {}
 
-        for step in child_steps:
-            self._attach_children(step, step_map, results, mutable_results)
+        # Process child steps bottom-up (every step before its ancestors)
+        for step in self._bottom_up(root_step, steps):
+            self._attach_children(step, step_map, results, mutable_results, link_cache)
 
         # Get the root items (now with all nested relations attached)
         root_items = mutable_results[root_step.id]
@@ -86,40 +90,55 @@ class ResponseAssembler:
                 return {"data": data}
             return {"data": None}
         else:
-            pagination = PaginationInfo(
-                total=root_result.total,
-                limit=root_result.limit,
-                offset=root_result.offset,
-                has_next=self._has_next(root_result),
-            )
             items = root_items
             if camel_case:
                 items = convert_keys_to_camel(items)
             return {
                 "data": {
                     "items": items,
-                    "pagination": pagination.model_dump(),
+                    # PaginationInfo shape, built as a plain dict (no model_dump pass)
+                    "pagination": {
+                        "total": root_result.total,
+                        "limit": root_result.limit,
+                        "offset": root_result.offset,
+                        "has_next": self._has_next(root_result),
+                    },
                 }
             }
 
-    def _sort_by_depth(
-        self,
-        steps: list[PlanStep],
-        step_map: dict[str, PlanStep],
-    ) -> list[PlanStep]:
-        """Sort steps by depth (deepest first)."""
+    def _as_mutable(self, items: list) -> list[dict]:
+        """
+        Return items as a list of mutable dicts.
 
-        def get_depth(step: PlanStep) -> int:
-            depth = 0
-            current = step
-            while current.depends_on:
-                depth += 1
-                current = step_map.get(current.depends_on)
-                if current is None:
-                    break
-            return depth
+        Validated responses hold plain dicts and are returned as is; items
+        of any other mapping type (e.g. responses built with
+        model_construct()) are converted once.
+        """
+        if not items or type(items[0]) is dict:
+            return items
+        return [dict(item) for item in items]
+
+    def _bottom_up(self, root_step: PlanStep, steps: list[PlanStep]) -> list[PlanStep]:
+        """
+        Order the steps below root so each comes before its ancestors.
 
-        return sorted(steps, key=get_depth, reverse=True)
+        Walks the attachment tree once (depth-first, iterative) and reverses
+        the visit order - no per-step depth computation or sorting.
+        """
+        children_of: defaultdict[str, list[PlanStep]] = defaultdict(list)
+        for step in steps:
+            parent_id = step.attach_to_step_id or step.depends_on
+            if parent_id:
+                children_of[parent_id].append(step)
+
+        order: list[PlanStep] = []
+        stack = list(children_of.get(root_step.id, ()))
+        while stack:
+            step = stack.pop()
+            order.append(step)
+            stack.extend(children_of.get(step.id, ()))
+        order.reverse()
+        return order
 
     def _attach_children(
         self,
@@ -127,6 +146,7 @@ class ResponseAssembler:
         step_map: dict[str, PlanStep],
         results: dict[str, InternalQueryResponse],
         mutable_results: dict[str, list[dict]],
+        link_cache: Optional[dict[tuple, dict[Any, Any]]] = None,
     ):
         """
         Attach child results to parent items.
@@ -157,39 +177,53 @@ class ResponseAssembler:
 
         # Get parent items from mutable results (these are the objects we modify)
         parent_items = mutable_results.get(parent_step.id, [])
-        # Get child items from mutable results (already converted to dicts)
+        # Get child items from mutable results (shared with deeper attachments)
         child_items = mutable_results.get(step.id, [])
 
         # Handle two-hop relations (through an intermediate step like Relationship)
         if step.attach_to_step_id and step.link_through_step_id and step.link_field:
             self._attach_via_link(
-                step, parent_step, parent_items, child_items, mutable_results
+                step, parent_step, parent_items, child_items, mutable_results, link_cache
             )
             return
 
         # Standard single-hop attachment
         # Build index of children by match field
-        children_by_key: dict[Any, list[dict]] = {}
-        if step.child_match_field:
+        # (lookups below use .get() so missing keys don't insert empty lists)
+        children_by_key: defaultdict[Any, list[dict]] = defaultdict(list)
+        match_field = step.child_match_field
+        if match_field:
             for child in child_items:
-                key = child.get(step.child_match_field)
+                key = child.get(match_field)
                 if key is not None:
-                    if key not in children_by_key:
-                        children_by_key[key] = []
                     children_by_key[key].append(child)
 
         # Attach to each parent item (modifying the mutable dict)
-        for parent_item in parent_items:
-            parent_key = parent_item.get(step.parent_key_field)
-
-            if step.cardinality == "one":
-                # Attach single item or null
-                children = children_by_key.get(parent_key, [])
-                parent_item[step.attach_as] = children[0] if children else None
-            else:
-                # Attach list directly (no pagination wrapper for nested relations)
-                children = children_by_key.get(parent_key, [])
-                parent_item[step.attach_as] = children
+        attach_as = step.attach_as
+        parent_key_field = step.parent_key_field
+        find_children = children_by_key.get
+        if step.alias_attach_as:
+            # Fused step: same children under several relation names
+            attachments = [(attach_as, step.cardinality == "one")] + [
+                (name, cardinality == "one") for name, cardinality in step.alias_attach_as
+            ]
+            for parent_item in parent_items:
+                children = find_children(parent_item.get(parent_key_field))
+                for name, is_one in attachments:
+                    if is_one:
+                        parent_item[name] = children[0] if children else None
+                    else:
+                        parent_item[name] = children if children is not None else []
+        elif step.cardinality == "one":
+            # Attach single item or null
+            for parent_item in parent_items:
+                children = find_children(parent_item.get(parent_key_field))
+                parent_item[attach_as] = children[0] if children else None
+        else:
+            # Attach list directly (no pagination wrapper for nested relations)
+            for parent_item in parent_items:
+                children = find_children(parent_item.get(parent_key_field))
+                parent_item[attach_as] = children if children is not None else []
 
     def _attach_via_link(
         self,
@@ -198,6 +232,7 @@ class ResponseAssembler:
         parent_items: list[dict],
         child_items: list[dict],
         mutable_results: dict[str, list[dict]],
+        link_cache: Optional[dict[tuple, dict[Any, Any]]] = None,
     ):
         """
         Attach children to parents via an intermediate linking step.
@@ -214,42 +249,76 @@ class ResponseAssembler:
 
         # Build mapping: child_id → parent_id
         # Using link step: parent_key_field (object_id) → link_field (subject_id)
-        # Note: IDs in Relationship are strings, but entity IDs may be integers
-        # Use string keys for consistency
-        child_to_parent: dict[str, str] = {}
-        for link_item in link_items:
-            child_id = link_item.get(step.parent_key_field)  # e.g., object_id
-            parent_id = link_item.get(step.link_field)       # e.g., subject_id
-            if child_id is not None and parent_id is not None:
-                child_to_parent[str(child_id)] = str(parent_id)
+        # Note: IDs in Relationship are strings, but entity IDs may be integers.
+        # Keys are compared as strings unless every key on both sides has
+        # the same type.
+        child_id_field = step.parent_key_field  # e.g., object_id
+        parent_id_field = step.link_field       # e.g., subject_id
+        match_field = step.child_match_field    # e.g., Property.id
+        str_child_keys = not _same_key_type(link_items, child_id_field, child_items, match_field)
+        str_parent_keys = not _same_key_type(link_items, parent_id_field, parent_items, "id")
+
+        cache_key = (step.link_through_step_id, child_id_field, parent_id_field, str_child_keys, str_parent_keys)
+        child_to_parent = link_cache.get(cache_key) if link_cache is not None else None
+        if child_to_parent is None:
+            child_to_parent = {}
+            for link_item in link_items:
+                child_id = link_item.get(child_id_field)
+                parent_id = link_item.get(parent_id_field)
+                if child_id is not None and parent_id is not None:
+                    if str_child_keys:
+                        child_id = str(child_id)
+                    if str_parent_keys:
+                        parent_id = str(parent_id)
+                    child_to_parent[child_id] = parent_id
+            if link_cache is not None:
+                link_cache[cache_key] = child_to_parent
 
         # Group children by their parent
-        children_by_parent: dict[str, list[dict]] = {}
+        children_by_parent: defaultdict[Any, list[dict]] = defaultdict(list)
 
         for child in child_items:
-            child_key = child.get(step.child_match_field)  # e.g., Property.id
+            child_key = child.get(match_field)
             if child_key is None:
                 continue
-            parent_id = child_to_parent.get(str(child_key))
+            parent_id = child_to_parent.get(str(child_key) if str_child_keys else child_key)
             if parent_id is not None:
-                if parent_id not in children_by_parent:
-                    children_by_parent[parent_id] = []
                 children_by_parent[parent_id].append(child)
 
         # Attach to each parent item
+        attach_as = step.attach_as
+        is_one = step.cardinality == "one"
+        find_children = children_by_parent.get
         for parent_item in parent_items:
             parent_key = parent_item.get("id")  # Parent key is typically "id"
-            parent_key_str = str(parent_key) if parent_key is not None else None
+            if str_parent_keys and parent_key is not None:
+                parent_key = str(parent_key)
 
-            if step.cardinality == "one":
-                children = children_by_parent.get(parent_key_str, [])
-                parent_item[step.attach_as] = children[0] if children else None
+            children = find_children(parent_key)
+            if is_one:
+                parent_item[attach_as] = children[0] if children else None
             else:
-                children = children_by_parent.get(parent_key_str, [])
-                parent_item[step.attach_as] = children
+                parent_item[attach_as] = children if children is not None else []
 
     def _has_next(self, result: InternalQueryResponse) -> bool:
         """Check if there are more items after current page."""
         if result.limit is None:
             return False
         return result.total > result.offset + len(result.items)
+
+
+def _key_types(items: list[dict], field: str) -> set[type]:
+    """Types of the non-null values of field in items."""
+    types = {type(item.get(field)) for item in items}
+    types.discard(type(None))
+    return types
+
+
+def _same_key_type(
+    left_items: list[dict],
+    left_field: str,
+    right_items: list[dict],
+    right_field: str,
+) -> bool:
+    """Check if all non-null values of two key columns share one type."""
+    return len(_key_types(left_items, left_field) | _key_types(right_items, right_field)) <= 1
@@ -8,7 +8,10 @@ from __future__ import annotations
 
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..iam.service import IAMResponse
 
 
 @dataclass
@@ -33,10 +36,12 @@ class ExecutionContext:
     - graph: The compiled supergraph schema
     - principal: Authenticated user info for IAM
     - services: Service URL mapping (from graph)
+    - iam_cache: Request-scoped IAM decisions, keyed by (action, entity)
     """
     graph: dict
     principal: Principal
     services: dict[str, dict] = field(default_factory=dict)
+    iam_cache: dict[tuple[str, str], IAMResponse] = field(default_factory=dict)
 
     def __post_init__(self):
         """Extract services from graph if not provided."""
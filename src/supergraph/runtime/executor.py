@@ -3,18 +3,21 @@ Plan executor - executes PlanSteps and collects results.
 
 Handles:
 - Topological sorting of steps by dependencies
+- Running independent steps (same dependency level) concurrently
+- Sharing one fetch between same-level steps that query the same rows
 - Resolving parent references ($step_x.field) in filters
 - Executing steps via ServiceClient
 """
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from typing import Any, Optional
 
 from ..core.errors import ExecutionError
 from ..core.query_types import InternalQueryResponse, NormalizedFilter
 from .context import ExecutionContext
-from .planner import PlanStep
+from .planner import PlanStep, QueryPlanner
 from .service_client import ServiceClient
 
 
@@ -51,48 +54,150 @@ class PlanExecutor:
         Returns:
             Dict mapping step.id to InternalQueryResponse
         """
-        # Topologically sort steps
-        sorted_steps = self._topological_sort(steps)
+        # Group steps into dependency waves (Kahn's algorithm)
+        levels = QueryPlanner.execution_waves(steps)
 
-        # Execute steps in order
+        # Execute level by level: steps of a level only depend on earlier
+        # levels, so they run concurrently
         results: dict[str, InternalQueryResponse] = {}
 
-        for step in sorted_steps:
-            try:
-                result = await self._execute_step(step, results, context)
-                results[step.id] = result
-            except Exception as e:
-                raise ExecutionError(str(e), step_id=step.id)
+        for level in levels:
+            if len(level) == 1:
+                step = level[0]
+                try:
+                    results[step.id] = await self._execute_step(step, results, context)
+                except Exception as e:
+                    raise ExecutionError(str(e), step_id=step.id)
+                continue
+
+            groups = self._group_shared_fetches(level, results)
+            outcomes = await asyncio.gather(
+                *(self._execute_group(group, results, context) for group in groups),
+                return_exceptions=True,
+            )
+            for group, outcome in zip(groups, outcomes):
+                if isinstance(outcome, Exception):
+                    raise ExecutionError(str(outcome), step_id=group[0].id)
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                for step, response in zip(group, outcome):
+                    results[step.id] = response
 
         return results
 
-    def _topological_sort(self, steps: list[PlanStep]) -> list[PlanStep]:
+    def _group_shared_fetches(
+        self,
+        level: list[PlanStep],
+        results: dict[str, InternalQueryResponse],
+    ) -> list[list[PlanStep]]:
         """
-        Sort steps by dependency order (parents before children).
+        Group steps of one level that can share a single fetch.
 
-        Steps without depends_on come first.
+        Steps under different parents that query the same entity with the
+        same match field, fields and filters (and no pagination) differ
+        only in their parent keys: one fetch with the union of the keys
+        serves all of them (DataLoader-style).
         """
-        # Build adjacency map
-        step_map = {step.id: step for step in steps}
-        visited: set[str] = set()
-        result: list[PlanStep] = []
-
-        def visit(step_id: str):
-            if step_id in visited:
-                return
-            step = step_map.get(step_id)
-            if not step:
-                return
-            # Visit dependency first
-            if step.depends_on and step.depends_on not in visited:
-                visit(step.depends_on)
-            visited.add(step_id)
-            result.append(step)
-
-        for step in steps:
-            visit(step.id)
-
-        return result
+        groups: list[list[PlanStep]] = []
+        by_key: dict[tuple, list[PlanStep]] = {}
+        for step in level:
+            key = self._shared_fetch_key(step) if step.depends_on in results else None
+            if key is None:
+                groups.append([step])
+                continue
+            group = by_key.get(key)
+            if group is None:
+                group = by_key[key] = [step]
+                groups.append(group)
+            else:
+                group.append(step)
+        return groups
+
+    @staticmethod
+    def _shared_fetch_key(step: PlanStep) -> Optional[tuple]:
+        """Key of the rows a dependent step fetches, apart from parent keys (None = not shareable)."""
+        if not (step.depends_on and step.parent_key_field and step.child_match_field):
+            return None
+        if step.limit is not None or step.offset or step.order:
+            return None
+        key = (
+            step.service,
+            step.entity,
+            step.child_match_field,
+            step.select_fields,
+            tuple(
+                (f.field, f.op, tuple(f.value) if isinstance(f.value, list) else f.value)
+                for f in step.get_all_filters()
+            ),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    async def _execute_group(
+        self,
+        group: list[PlanStep],
+        results: dict[str, InternalQueryResponse],
+        context: ExecutionContext,
+    ) -> list[InternalQueryResponse]:
+        """Execute a group of steps (see _group_shared_fetches), one response per step."""
+        if len(group) == 1:
+            return [await self._execute_step(group[0], results, context)]
+
+        first = group[0]
+        service_url = context.get_service_url(first.service)
+        if not service_url:
+            raise ExecutionError(f"Service '{first.service}' not found")
+
+        keys_per_step = [self._parent_keys(step, results) for step in group]
+        all_keys = list(dict.fromkeys(k for keys in keys_per_step for k in keys))
+        if not all_keys:
+            return [InternalQueryResponse(items=[], total=0, limit=None, offset=0) for _ in group]
+
+        response = await self.client.fetch(
+            service_url=service_url,
+            entity=first.entity,
+            filters=[
+                NormalizedFilter(field=first.child_match_field, op="in", value=all_keys),
+                *first.filters,
+                *first.guard,
+            ],
+            fields=first.select_fields,
+        )
+
+        # Scatter rows back to the steps that asked for their key. Services
+        # coerce filter values per column, so compare as strings on a miss.
+        match_field = first.child_match_field
+        per_step_items = []
+        attributed: set[int] = set()
+        for keys in keys_per_step:
+            wanted = set(keys)
+            wanted_str = {str(k) for k in keys}
+            items = [
+                item for item in response.items
+                if (value := item.get(match_field)) in wanted
+                or (value is not None and str(value) in wanted_str)
+            ]
+            attributed.update(map(id, items))
+            per_step_items.append(items)
+
+        if len(attributed) < len(response.items):
+            # The service matched some rows by coercion this side can't repeat
+            # ("1.00" for 1, UUID case): fetch per step instead
+            # of silently dropping them
+            return list(await asyncio.gather(
+                *(self._execute_step(step, results, context) for step in group)
+            ))
+
+        responses = []
+        for position, items in enumerate(per_step_items):
+            if position:
+                # Rows get nested children attached per step: don't share them
+                items = [dict(item) for item in items]
+            responses.append(InternalQueryResponse(items=items, total=len(items), limit=None, offset=0))
+        return responses
 
     async def _execute_step(
         self,
@@ -116,11 +221,17 @@ class PlanExecutor:
         if not service_url:
             raise ExecutionError(f"Service '{step.service}' not found")
 
+        # Parent returned nothing - nothing to match, skip resolving filters
+        if step.depends_on and step.parent_key_field and step.child_match_field:
+            parent_result = results.get(step.depends_on)
+            if parent_result is not None and not parent_result.items:
+                return InternalQueryResponse(items=[], total=0, limit=step.limit, offset=step.offset)
+
         # Resolve filters (including parent references)
         resolved_filters = self._resolve_filters(step, results)
 
         # Combine with guard filters
-        all_filters = resolved_filters + step.guard
+        all_filters = [*resolved_filters, *step.guard]
 
         # Check if we have any items to fetch (for dependent steps)
         if step.depends_on and step.child_match_field:
@@ -158,22 +269,13 @@ class PlanExecutor:
 
         # If this step depends on another, create the linking filter
         if step.depends_on and step.parent_key_field and step.child_match_field:
-            parent_result = results.get(step.depends_on)
-            if parent_result:
-                # Extract parent key values
-                parent_ids = self._extract_field_values(
-                    parent_result.items,
-                    step.parent_key_field
-                )
-                # Convert to strings for subject_id/object_id fields (they're varchar in Relationship table)
-                if step.child_match_field in ("subject_id", "object_id"):
-                    parent_ids = [str(v) for v in parent_ids]
+            if results.get(step.depends_on):
                 # Add IN filter
                 resolved.append(
                     NormalizedFilter(
                         field=step.child_match_field,
                         op="in",
-                        value=parent_ids,
+                        value=self._parent_keys(step, results),
                     )
                 )
 
@@ -182,13 +284,44 @@ class PlanExecutor:
 
         return resolved
 
+    def _parent_keys(self, step: PlanStep, results: dict[str, InternalQueryResponse]) -> list[Any]:
+        """Unique parent key values a dependent step matches against."""
+        parent_ids = self._extract_field_values(
+            results[step.depends_on].items,
+            step.parent_key_field
+        )
+        # Convert to strings for subject_id/object_id fields (they're varchar in Relationship table)
+        if step.child_match_field in ("subject_id", "object_id"):
+            parent_ids = [str(v) for v in parent_ids]
+        return self._restrict_keys(step, parent_ids)
+
+    @staticmethod
+    def _restrict_keys(step: PlanStep, parent_ids: list[Any]) -> list[Any]:
+        """
+        Drop parent keys the step's own eq/in filters on the match field exclude.
+
+        The filters stay on the step (the result is the same); the IN list
+        just shrinks, and an empty one skips the fetch altogether. Only
+        applies when parent keys and filter values all share one type:
+        services coerce values per column (1 matches "1", 1.0, Decimal), so
+        mixed types are left for the service to match.
+        """
+        key_types = {type(key) for key in parent_ids}
+        for f in step.filters:
+            if f.field != step.child_match_field or f.op not in ("eq", "in"):
+                continue
+            allowed = f.value if f.op == "in" else [f.value]
+            if not isinstance(allowed, (list, tuple)):
+                continue
+            if len(key_types.union(map(type, allowed))) > 1:
+                continue
+            allowed_set = set(allowed)
+            parent_ids = [key for key in parent_ids if key in allowed_set]
+        return parent_ids
+
     def _extract_field_values(self, items: list[dict], field: str) -> list[Any]:
-        """Extract unique values of a field from items."""
-        values = []
-        seen = set()
-        for item in items:
-            value = item.get(field)
-            if value is not None and value not in seen:
-                values.append(value)
-                seen.add(value)
-        return values
+        """Extract unique values of a field from items (first-seen order)."""
+        # dict.fromkeys dedups in C and keeps insertion order
+        values = dict.fromkeys(item.get(field) for item in items)
+        values.pop(None, None)
+        return list(values)
@@ -12,13 +12,26 @@ import httpx
 from typing import Any
 
 from supergraph.core.query_types import (
-    NormalizedFilter,
-    InternalMutationRequest,
+    InternalBatchResponse,
     InternalMutationResponse,
     MutationResult,
 )
 from supergraph.core.request_parser import EntityMutation
 from supergraph.core.errors import ExecutionError
+from supergraph.core.serialization import json_dumps
+from supergraph.runtime.service_client import create_http_client
+
+
+# Internal endpoint path per operation (same pattern as service_client: /internal/{operation})
+_OPERATION_PATHS = {
+    operation: f"/internal/{operation}"
+    for operation in ("create", "update", "rewrite", "delete", "get_or_create")
+}
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Operations services accept in POST /internal/batch
+_BATCH_OPERATIONS = frozenset({"create", "update", "rewrite", "delete"})
 
 
 class MutationExecutor:
@@ -30,6 +43,7 @@ class MutationExecutor:
     - POST /internal/update - partial update (PATCH semantics)
     - POST /internal/rewrite - full replace (PUT semantics)
     - POST /internal/delete - delete records
+    - POST /internal/batch - several mutations in one request (optional)
     """
 
     def __init__(self, graph: dict[str, Any], http_client: httpx.AsyncClient | None = None):
@@ -41,9 +55,20 @@ class MutationExecutor:
             http_client: Optional shared HTTP client
         """
         self.graph = graph
-        self.http_client = http_client or httpx.AsyncClient(timeout=30.0)
+        self.http_client = http_client or create_http_client(timeout=30.0)
         self._owns_client = http_client is None
 
+        # Services that answered /internal/batch with 404/405 (older services)
+        self._no_batch_urls: set[str] = set()
+
+        # Resolve entity → service URL once (the graph is fixed for this executor)
+        services = graph.get("services", {})
+        self._entity_urls: dict[str, str] = {}
+        for entity_name, entity_def in graph.get("entities", {}).items():
+            service_def = services.get(entity_def.get("service"))
+            if service_def and "url" in service_def:
+                self._entity_urls[entity_name] = service_def["url"]
+
     async def close(self):
         """Close HTTP client if we own it."""
         if self._owns_client:
@@ -51,6 +76,10 @@ class MutationExecutor:
 
     def get_service_url(self, entity: str) -> str:
         """Get service URL for entity."""
+        url = self._entity_urls.get(entity)
+        if url is not None:
+            return url
+
         entity_def = self.graph["entities"].get(entity)
         if not entity_def:
             raise ExecutionError(f"Unknown entity: {entity}")
@@ -75,65 +104,183 @@ class MutationExecutor:
         try:
             base_url = self.get_service_url(mutation.entity)
 
-            # Build internal request
-            filters = self._normalize_filters(mutation.filters)
-            request = InternalMutationRequest(
-                entity=mutation.entity,
-                operation=mutation.operation,
-                data=mutation.data,
-                filters=filters,
-                response=mutation.response,
-            )
-
-            # Determine endpoint (same pattern as service_client: /internal/{operation})
-            endpoint = f"{base_url}/internal/{mutation.operation}"
+            # Determine endpoint
+            path = _OPERATION_PATHS.get(mutation.operation)
+            if path is None:
+                raise ExecutionError(f"Unknown operation: {mutation.operation}")
+            endpoint = base_url + path
 
             # Execute request
-            response = await self.http_client.post(
-                endpoint,
-                json=request.model_dump(),
-            )
+            response = await self._post_json(endpoint, self._build_request(mutation))
 
             if response.status_code >= 400:
-                return MutationResult(
-                    entity=mutation.entity,
-                    operation=mutation.operation,
-                    success=False,
-                    error=f"Service error: {response.status_code} - {response.text}",
-                )
+                return self._failed(mutation, f"Service error: {response.status_code} - {response.text}")
 
             result = InternalMutationResponse.model_validate(response.json())
+            return self._succeeded(mutation, result)
+
+        except httpx.HTTPError as e:
+            return self._failed(mutation, f"HTTP error: {str(e)}")
+        except Exception as e:
+            return self._failed(mutation, f"Execution error: {str(e)}")
 
-            # Return appropriate data format
-            if mutation.operation == "create":
-                data = result.items[0] if result.items else None
-            elif mutation.operation == "delete":
-                data = None
+    async def execute_batch(self, mutations: list[EntityMutation]) -> list[MutationResult]:
+        """
+        Execute several mutations with one request per run of one service.
+
+        Mutations run strictly in request order: consecutive mutations of
+        one service are sent together to POST /internal/batch, and runs
+        (services) are executed one after another, so a mutation may rely
+        on any earlier one. Like /internal/batch, a failed mutation does not
+        stop the ones after it, and nothing is compensated. Services without
+        the batch endpoint fall back to one request per mutation.
+
+        Args:
+            mutations: Parsed mutation requests
+
+        Returns:
+            MutationResults in the same order as mutations
+        """
+        results: list[MutationResult] = []
+        run: list[EntityMutation] = []  # Consecutive mutations of one service
+        run_url: str | None = None
+
+        for mutation in mutations:
+            try:
+                base_url = self.get_service_url(mutation.entity)
+            except ExecutionError as e:
+                base_url = None
+                failed = self._failed(mutation, f"Execution error: {str(e)}")
+            if run and base_url != run_url:
+                results.extend(await self._execute_service_batch(run_url, run))
+                run = []
+            if base_url is None:
+                results.append(failed)
             else:
-                data = result.items
-
-            return MutationResult(
-                entity=mutation.entity,
-                operation=mutation.operation,
-                success=True,
-                data=data,
-                count=result.count,
+                run.append(mutation)
+                run_url = base_url
+
+        if run:
+            results.extend(await self._execute_service_batch(run_url, run))
+        return results
+
+    async def execute_bulk_create(
+        self,
+        entity: str,
+        data: list[dict[str, Any]],
+        responses: list[list[str] | None] | None = None,
+    ) -> list[MutationResult]:
+        """
+        Create several records of one entity in a single request.
+
+        Sent through POST /internal/batch (one request per record on
+        services without it).
+
+        Args:
+            entity: Entity name
+            data: Field values per record
+            responses: Fields to return per record (default: all)
+
+        Returns:
+            MutationResults in the same order as data
+        """
+        if responses is None:
+            responses = [None] * len(data)
+        return await self.execute_batch([
+            EntityMutation(entity=entity, operation="create", data=values, response=response)
+            for values, response in zip(data, responses)
+        ])
+
+    async def _execute_service_batch(
+        self,
+        base_url: str,
+        mutations: list[EntityMutation],
+    ) -> list[MutationResult]:
+        """Execute mutations of one service, batched when possible."""
+        if (
+            len(mutations) == 1
+            or base_url in self._no_batch_urls
+            or any(m.operation not in _BATCH_OPERATIONS for m in mutations)
+        ):
+            return [await self.execute(mutation) for mutation in mutations]
+
+        try:
+            response = await self._post_json(
+                base_url + "/internal/batch",
+                {"operations": [self._build_request(m) for m in mutations]},
             )
+            if response.status_code in (404, 405):
+                # Service predates /internal/batch - remember and fall back
+                self._no_batch_urls.add(base_url)
+                return [await self.execute(mutation) for mutation in mutations]
+
+            if response.status_code >= 400:
+                error = f"Service error: {response.status_code} - {response.text}"
+                return [self._failed(mutation, error) for mutation in mutations]
+
+            batch = InternalBatchResponse.model_validate(response.json())
+            if len(batch.results) != len(mutations):
+                raise ExecutionError(
+                    f"Batch returned {len(batch.results)} results for {len(mutations)} operations"
+                )
 
         except httpx.HTTPError as e:
-            return MutationResult(
-                entity=mutation.entity,
-                operation=mutation.operation,
-                success=False,
-                error=f"HTTP error: {str(e)}",
-            )
+            return [self._failed(mutation, f"HTTP error: {str(e)}") for mutation in mutations]
         except Exception as e:
-            return MutationResult(
-                entity=mutation.entity,
-                operation=mutation.operation,
-                success=False,
-                error=f"Execution error: {str(e)}",
-            )
+            return [self._failed(mutation, f"Execution error: {str(e)}") for mutation in mutations]
+
+        return [
+            self._failed(mutation, f"Service error: {result.error}")
+            if result.error is not None
+            else self._succeeded(mutation, result)
+            for mutation, result in zip(mutations, batch.results)
+        ]
+
+    async def _post_json(self, url: str, body: dict[str, Any]) -> httpx.Response:
+        """POST body encoded with the fast JSON encoder (orjson when installed)."""
+        return await self.http_client.post(url, content=json_dumps(body), headers=_JSON_HEADERS)
+
+    def _build_request(self, mutation: EntityMutation) -> dict[str, Any]:
+        """
+        Build internal request body for mutation.
+
+        Same shape as InternalMutationRequest, built directly - the parsed
+        mutation is already validated.
+        """
+        return {
+            "entity": mutation.entity,
+            "operation": mutation.operation,
+            "data": mutation.data,
+            "filters": self._normalize_filters(mutation.filters),
+            "response": mutation.response,
+        }
+
+    def _succeeded(self, mutation: EntityMutation, result: InternalMutationResponse) -> MutationResult:
+        """Build successful MutationResult from service response."""
+        # Return appropriate data format
+        if mutation.operation == "create":
+            data = result.items[0] if result.items else None
+        elif mutation.operation == "delete":
+            data = None
+        else:
+            data = result.items
+
+        return MutationResult(
+            entity=mutation.entity,
+            operation=mutation.operation,
+            success=True,
+            data=data,
+            count=result.count,
+        )
+
+    def _failed(self, mutation: EntityMutation, error: str) -> MutationResult:
+        """Build failed MutationResult."""
+        return MutationResult(
+            entity=mutation.entity,
+            operation=mutation.operation,
+            success=False,
+            error=error,
+        )
 
     async def execute_compensation(self, entity: str, record_id: Any) -> bool:
         """
@@ -145,6 +292,21 @@ class MutationExecutor:
             entity: Entity name
             record_id: ID of record to delete
 
+        Returns:
+            True if compensation succeeded
+        """
+        return await self.execute_compensation_batch(entity, [record_id])
+
+    async def execute_compensation_batch(self, entity: str, record_ids: list[Any]) -> bool:
+        """
+        Execute compensation (delete) for several created records of one entity.
+
+        One delete request (key IN ids) instead of one per record.
+
+        Args:
+            entity: Entity name
+            record_ids: IDs of records to delete
+
         Returns:
             True if compensation succeeded
         """
@@ -155,29 +317,37 @@ class MutationExecutor:
             entity_def = self.graph["entities"][entity]
             key_field = entity_def["keys"][0] if entity_def.get("keys") else "id"
 
-            request = InternalMutationRequest(
-                entity=entity,
-                operation="delete",
-                filters=[NormalizedFilter(field=key_field, op="eq", value=record_id)],
-            )
+            if len(record_ids) == 1:
+                key_filter = {"field": key_field, "op": "eq", "value": record_ids[0]}
+            else:
+                key_filter = {"field": key_field, "op": "in", "value": list(record_ids)}
+
+            # InternalMutationRequest shape, built directly
+            request = {
+                "entity": entity,
+                "operation": "delete",
+                "data": {},
+                "filters": [key_filter],
+                "response": None,
+            }
 
-            endpoint = f"{base_url}/internal/delete"
-            response = await self.http_client.post(endpoint, json=request.model_dump())
+            endpoint = base_url + _OPERATION_PATHS["delete"]
+            response = await self._post_json(endpoint, request)
 
             return response.status_code < 400
 
         except Exception:
             return False
 
-    def _normalize_filters(self, filters: dict[str, Any]) -> list[NormalizedFilter]:
-        """Convert filter dict to normalized filter list."""
+    def _normalize_filters(self, filters: dict[str, Any]) -> list[dict[str, Any]]:
+        """Convert filter dict to normalized filter list (NormalizedFilter dicts)."""
         result = []
         for key, value in filters.items():
             if "__" in key:
                 field, op = key.rsplit("__", 1)
             else:
                 field, op = key, "eq"
-            result.append(NormalizedFilter(field=field, op=op, value=value))
+            result.append({"field": field, "op": op, "value": value})
         return result
 
     def validate_mutation(self, mutation: EntityMutation) -> list[str]:
@@ -8,9 +8,14 @@ that can be executed in dependency order.
 from __future__ import annotations
 
 
-from dataclasses import dataclass, field
-from typing import Any, Literal, Optional
-
+import copy
+import datetime
+import sys
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, fields
+from typing import Any, Literal, Optional, Sequence
+
+from ..core.errors import PlanningError
 from ..core.query_types import (
     NormalizedExpandNode,
     NormalizedFilter,
@@ -20,6 +25,22 @@ from ..core.query_types import (
 )
 
 
+def _add_slots(cls):
+    """
+    Recreate a dataclass with __slots__ (dataclass(slots=True) needs 3.10+).
+
+    Field defaults are already baked into the generated __init__, so the
+    class attributes holding them can be dropped in favour of slots.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in names}
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_add_slots
 @dataclass
 class PlanStep:
     """
@@ -32,13 +53,13 @@ class PlanStep:
     entity: str
     service: str
 
-    # Filters
-    filters: list[NormalizedFilter]  # Client filters (normalized)
-    guard: list[NormalizedFilter] = field(default_factory=list)  # IAM mandatory filters
+    # Filters (immutable: replace, don't mutate)
+    filters: tuple[NormalizedFilter, ...]  # Client filters (normalized)
+    guard: tuple[NormalizedFilter, ...] = ()  # IAM mandatory filters
 
     # Selection
-    select_fields: list[str] = field(default_factory=list)
-    order: list[NormalizedOrder] = field(default_factory=list)
+    select_fields: tuple[str, ...] = ()
+    order: tuple[NormalizedOrder, ...] = ()
     limit: Optional[int] = None
     offset: int = 0
 
@@ -58,9 +79,378 @@ class PlanStep:
     is_expand: bool = False  # True if this is an expand step (parent lookup)
     expand_fk_field: Optional[str] = None  # FK field in parent entity (e.g., "make_id")
 
-    def get_all_filters(self) -> list[NormalizedFilter]:
-        """Get combined client filters and guard filters."""
-        return self.filters + self.guard
+    # Fused sibling steps: extra (attach_as, cardinality) pairs fed by this fetch
+    alias_attach_as: list[tuple[str, Optional[str]]] = field(default_factory=list)
+
+    # get_all_filters() cache: (filters, guard, combined)
+    _all_filters: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """
+        Freeze collection fields (callers may pass lists) and intern names
+        that recur across steps and plans (entity, service, field names).
+        """
+        for name in ("filters", "guard", "order"):
+            value = getattr(self, name)
+            if type(value) is not tuple:
+                setattr(self, name, tuple(value))
+        self.select_fields = tuple(map(sys.intern, self.select_fields))
+        for name in ("entity", "service", "parent_key_field", "child_match_field", "attach_as", "link_field"):
+            value = getattr(self, name)
+            if value is not None:
+                setattr(self, name, sys.intern(value))
+        # init=False fields get no class-level default under __slots__
+        self._all_filters = None
+
+    def get_all_filters(self) -> tuple[NormalizedFilter, ...]:
+        """
+        Get combined client filters and guard filters.
+
+        The result is cached until filters or guard are replaced (IAM adds
+        guards after planning).
+        """
+        filters, guard = self.filters, self.guard
+        cached = self._all_filters
+        if cached is None or cached[0] is not filters or cached[1] is not guard:
+            cached = self._all_filters = (filters, guard, filters + guard)
+        return cached[2]
+
+
+@dataclass(frozen=True)
+class _EntityInfo:
+    """Planner view of an entity definition (defaults resolved)."""
+    service: Optional[str]
+    keys: tuple[str, ...]
+    first_key: str
+    relations: dict[str, dict]
+    indexed: frozenset[str] = frozenset()  # Keys and leading index columns
+    # relation name -> resolved mapping (filled lazily by the planner)
+    mappings: dict[str, tuple] = field(default_factory=dict, compare=False, repr=False)
+
+
+@dataclass(frozen=True)
+class _ProviderInfo:
+    """Relation provider config (defaults resolved)."""
+    entity: str = "Relationship"
+    service: str = "relations"
+    subject_field: str = "subject_id"
+    object_field: str = "object_id"
+    type_field: str = "relationship_type"
+    status_field: str = "status"
+
+
+_DEFAULT_PROVIDER = _ProviderInfo()
+
+# Filter evaluation order: cheap/selective predicates first
+_OP_RANK = {
+    "eq": 0,
+    "in": 1,
+    "isnull": 2,
+    "gt": 2,
+    "gte": 2,
+    "lt": 2,
+    "lte": 2,
+    "ne": 3,
+    "contains": 4,
+    "icontains": 5,
+}
+
+
+def _direction_fields(direction: str, provider: _ProviderInfo) -> tuple[str, str]:
+    """
+    Relationship fields for a provider relation direction.
+
+    Returns:
+        Tuple of (field matching the parent key, field holding the target key)
+        - direction="in": parent.id -> subject_id, target from object_id
+        - direction="out": parent.id -> object_id, target from subject_id
+    """
+    if direction == "in":
+        return provider.subject_field, provider.object_field
+    return provider.object_field, provider.subject_field
+
+
+def _index_columns(entity_def: dict) -> list[str]:
+    """Leading column of each declared index (plain field name or list of fields)."""
+    columns = []
+    for index in entity_def.get("indexes", []):
+        if isinstance(index, str):
+            columns.append(index)
+        elif index:
+            columns.append(index[0])
+    return columns
+
+
+_RANGE_OPS = frozenset(("gt", "gte", "lt", "lte"))
+_ORDERED_TYPES = (int, float, datetime.date)
+
+
+def _fuse_field(group: list[NormalizedFilter]) -> Optional[list[NormalizedFilter]]:
+    """
+    Fuse filters on one field (combined with AND) into fewer filters.
+
+    - eq/in: intersection of the value sets, as a single eq or in
+    - gt/gte/lt/lte: tightest lower and upper bound
+
+    Returns None if the group can't be fused safely (other ops, mixed or
+    unhashable values, strings compared as ranges).
+    """
+    ops = {f.op for f in group}
+    name = group[0].field
+
+    if ops <= {"eq", "in"}:
+        values: Optional[list] = None
+        value_types = set()
+        try:
+            for f in group:
+                candidates = f.value if f.op == "in" else [f.value]
+                if not isinstance(candidates, (list, tuple)):
+                    return None
+                value_types.update(type(v) for v in candidates)
+                allowed = set(candidates)
+                values = list(dict.fromkeys(candidates)) if values is None else [
+                    v for v in values if v in allowed
+                ]
+        except TypeError:
+            return None
+        # Services coerce values per column, so "5" and 5 may match the same row
+        if len(value_types) > 1:
+            return None
+        if len(values) == 1:
+            return [NormalizedFilter(field=name, op="eq", value=values[0])]
+        return [NormalizedFilter(field=name, op="in", value=values)]
+
+    if ops <= _RANGE_OPS:
+        if not all(
+            isinstance(f.value, _ORDERED_TYPES) and not isinstance(f.value, bool)
+            for f in group
+        ):
+            return None
+        lower = upper = None
+        try:
+            for f in group:
+                if f.op in ("gt", "gte"):
+                    if lower is None or f.value > lower.value or (
+                        f.value == lower.value and f.op == "gt"
+                    ):
+                        lower = f
+                elif upper is None or f.value < upper.value or (
+                    f.value == upper.value and f.op == "lt"
+                ):
+                    upper = f
+        except TypeError:
+            return None
+        return [f for f in (lower, upper) if f is not None]
+
+    return None
+
+
+def _fuse_predicates(filters: Sequence[NormalizedFilter]) -> Sequence[NormalizedFilter]:
+    """
+    Fuse filters on the same field (see _fuse_field).
+
+    Filters are combined with AND, so fusing never changes the result set.
+    Fused filters take the position of the field's first filter.
+    """
+    by_field: dict[str, list[NormalizedFilter]] = {}
+    for f in filters:
+        by_field.setdefault(f.field, []).append(f)
+    if len(by_field) == len(filters):
+        return filters
+
+    fused = {}
+    for name, group in by_field.items():
+        if len(group) > 1:
+            replacement = _fuse_field(group)
+            if replacement is not None:
+                fused[name] = replacement
+    if not fused:
+        return filters
+
+    result = []
+    for f in filters:
+        replacement = fused.get(f.field)
+        if replacement is None:
+            result.append(f)
+        elif f is by_field[f.field][0]:
+            result.extend(replacement)
+    return result
+
+
+def _order_filters(steps: list[PlanStep], entity_info: dict[str, _EntityInfo]) -> None:
+    """
+    Fuse and sort each step's filters by estimated selectivity (in place).
+
+    Equality before ranges before negations and substring matches;
+    indexed fields first within a rank. The sort is stable, so filters
+    of equal rank keep the client's order.
+    """
+    for step in steps:
+        if len(step.filters) < 2:
+            continue
+        info = entity_info.get(step.entity)
+        indexed = info.indexed if info else frozenset()
+        step.filters = tuple(sorted(
+            _fuse_predicates(step.filters),
+            key=lambda f: (_OP_RANK.get(f.op, 9), 0 if f.field in indexed else 1),
+        ))
+
+
+# (entity, counter) -> interned step ID; bounded by entities x plan size
+_step_ids: dict[tuple[str, int], str] = {}
+
+# Per-graph index cache (LRU): id(graph) -> (graph, index). Bounded, so
+# graphs replaced by hot reloads or tests don't stay alive forever.
+PLANNER_INDEX_CACHE_SIZE = 8
+_planner_indexes: OrderedDict[int, tuple[dict, tuple[dict[str, _EntityInfo], dict[str, _ProviderInfo]]]] = OrderedDict()
+
+
+def build_planner_index(graph: dict) -> tuple[dict[str, _EntityInfo], dict[str, _ProviderInfo]]:
+    """
+    Build entity and relation provider lookups for a graph.
+
+    Args:
+        graph: Compiled supergraph JSON
+
+    Returns:
+        Tuple of (entity name -> _EntityInfo, provider name -> _ProviderInfo)
+    """
+    entities: dict[str, _EntityInfo] = {}
+    for entity_name, entity_def in graph.get("entities", {}).items():
+        keys = tuple(map(sys.intern, entity_def.get("keys", ["id"])))
+        service = entity_def.get("service")
+        entities[entity_name] = _EntityInfo(
+            service=sys.intern(service) if service else service,
+            keys=keys,
+            first_key=keys[0],
+            relations=entity_def.get("relations", {}),
+            indexed=frozenset(keys).union(_index_columns(entity_def)),
+        )
+
+    providers: dict[str, _ProviderInfo] = {}
+    for provider_name, provider in graph.get("relation_providers", {}).items():
+        providers[provider_name] = _ProviderInfo(
+            entity=provider.get("entity", "Relationship"),
+            service=provider.get("service", "relations"),
+            subject_field=provider.get("subject_field", "subject_id"),
+            object_field=provider.get("object_field", "object_id"),
+            type_field=provider.get("type_field", "relationship_type"),
+            status_field=provider.get("status_field", "status"),
+        )
+    return entities, providers
+
+
+def get_planner_index(graph: dict) -> tuple[dict[str, _EntityInfo], dict[str, _ProviderInfo]]:
+    """
+    Get the planner index for a graph, building it on first use.
+
+    Cached per graph object, like the IAM access index (planners are
+    created per query, so the index must outlive them).
+    """
+    cached = _planner_indexes.get(id(graph))
+    if cached is not None and cached[0] is graph:
+        _planner_indexes.move_to_end(id(graph))
+        return cached[1]
+    index = build_planner_index(graph)
+    _planner_indexes[id(graph)] = (graph, index)
+    _planner_indexes.move_to_end(id(graph))
+    if len(_planner_indexes) > PLANNER_INDEX_CACHE_SIZE:
+        _planner_indexes.popitem(last=False)
+    return index
+
+
+# Plan templates shared by all planners: (id(graph), query signature) ->
+# (graph, template). Plans depend on the query shape only, not on filter
+# values, so queries differing only in literals reuse one template.
+PLAN_CACHE_SIZE = 512
+_plan_cache: OrderedDict[tuple, tuple[dict, list[tuple[PlanStep, Any, int]]]] = OrderedDict()
+
+
+def _selection_signature(node: NormalizedSelectionNode) -> tuple:
+    """Hashable shape of a selection node (filter values excluded)."""
+    return (
+        tuple(node.fields),
+        tuple((f.field, f.op) for f in node.filters),
+        tuple((o.field, o.dir) for o in node.order),
+        node.limit,
+        node.offset,
+        tuple((name, _selection_signature(child)) for name, child in node.relations.items()),
+        tuple(
+            (name, tuple(e.fields), e.fk_field, e.target_entity)
+            for name, e in node.expand.items()
+        ),
+    )
+
+
+def _query_signature(query: NormalizedQuery) -> tuple:
+    """Hashable shape of a query (filter values excluded)."""
+    return (
+        query.entity,
+        tuple((f.field, f.op) for f in query.filters),
+        _selection_signature(query.select),
+    )
+
+
+def _filter_sources(query: NormalizedQuery) -> dict[Any, list[NormalizedFilter]]:
+    """
+    Map each filter source of a query to its filters.
+
+    Sources are relation paths (tuples of relation names) for selection
+    filters and None for root query filters.
+    """
+    sources: dict[Any, list[NormalizedFilter]] = {None: query.filters}
+    stack = [((), query.select)]
+    while stack:
+        path, node = stack.pop()
+        sources[path] = node.filters
+        for name, child in node.relations.items():
+            stack.append((path + (name,), child))
+    return sources
+
+
+def _make_template(steps: list[PlanStep], query: NormalizedQuery) -> list[tuple[PlanStep, Any, int]]:
+    """
+    Build a reusable plan template from freshly planned steps.
+
+    Each entry is (step copy, filter source, number of leading user
+    filters); the rest of the step's filters are static (from the graph).
+    """
+    owner = {
+        id(f): source
+        for source, filters in _filter_sources(query).items()
+        for f in filters
+    }
+    template = []
+    for step in steps:
+        # User filters come first (planner prepends them to static filters)
+        source = None
+        user_count = 0
+        if step.filters and id(step.filters[0]) in owner:
+            source = owner[id(step.filters[0])]
+            for f in step.filters:
+                if id(f) not in owner or owner[id(f)] != source:
+                    break
+                user_count += 1
+        frozen = copy.copy(step)
+        frozen.filters = step.filters[user_count:]  # static filters only
+        frozen.guard = ()
+        frozen.alias_attach_as = list(step.alias_attach_as)
+        template.append((frozen, source, user_count))
+    return template
+
+
+def _instantiate(template: list[tuple[PlanStep, Any, int]], query: NormalizedQuery) -> list[PlanStep]:
+    """Create plan steps from a template with the query's filter values."""
+    sources = _filter_sources(query)
+    steps = []
+    for frozen, source, user_count in template:
+        step = copy.copy(frozen)
+        if user_count:
+            step.filters = (*sources[source][:user_count], *frozen.filters)
+        step.guard = ()
+        step.alias_attach_as = list(frozen.alias_attach_as)
+        steps.append(step)
+    return steps
 
 
 class QueryPlanner:
@@ -82,12 +472,18 @@ class QueryPlanner:
         self.graph = graph
         self.entities = graph.get("entities", {})
         self.services = graph.get("services", {})
+        self._entity_info, self._providers = get_planner_index(graph)
         self._step_counter = 0
+        self._fusable: set[str] = set()  # Step IDs eligible for sibling fusion
 
     def _next_step_id(self, entity: str) -> str:
-        """Generate unique step ID."""
+        """Generate unique step ID (interned, shared across plans)."""
         self._step_counter += 1
-        return f"step_{entity.lower()}_{self._step_counter}"
+        key = (entity, self._step_counter)
+        step_id = _step_ids.get(key)
+        if step_id is None:
+            step_id = _step_ids[key] = sys.intern(f"step_{entity.lower()}_{self._step_counter}")
+        return step_id
 
     def plan(self, query: NormalizedQuery) -> list[PlanStep]:
         """
@@ -99,18 +495,124 @@ class QueryPlanner:
         Returns:
             List of PlanSteps in dependency order (root first)
         """
+        if query.entity not in self._entity_info:
+            raise PlanningError(f"entity '{query.entity}' not found in graph")
+
+        # Scan-only query: a single root step, no relation planning or caching
+        if not query.select.relations and not query.select.expand:
+            self._step_counter = 0
+            steps = [self._create_root_step(query)]
+            _order_filters(steps, self._entity_info)
+            return steps
+
+        # Reuse the plan of an earlier query with the same shape
+        key = (id(self.graph), _query_signature(query))
+        cached = _plan_cache.get(key)
+        if cached is not None and cached[0] is self.graph:
+            _plan_cache.move_to_end(key)
+            steps = _instantiate(cached[1], query)
+            _order_filters(steps, self._entity_info)
+            return steps
+
+        self._validate_selection(query.entity, query.select)
+        steps = self._build_plan(query)
+
+        # Template is taken before reordering (it relies on user filters leading)
+        _plan_cache[key] = (self.graph, _make_template(steps, query))
+        if len(_plan_cache) > PLAN_CACHE_SIZE:
+            _plan_cache.popitem(last=False)
+        _order_filters(steps, self._entity_info)
+        return steps
+
+    def plan_layered(self, query: NormalizedQuery) -> list[list[PlanStep]]:
+        """
+        Build execution plan grouped by wave.
+
+        Returns:
+            List of waves (root wave first); each wave only depends on
+            earlier ones
+        """
+        return self.execution_waves(self.plan(query))
+
+    @staticmethod
+    def execution_waves(steps: list[PlanStep]) -> list[list[PlanStep]]:
+        """
+        Group steps into waves that can run concurrently.
+
+        Kahn's algorithm, one level at a time: wave 0 holds steps without
+        a dependency in the list, each next wave the children of the
+        previous one. Works on any step list (e.g. after IAM dropped
+        steps), O(steps).
+        """
+        step_ids = {step.id for step in steps}
+        children_of: dict[str, list[PlanStep]] = {}
+        wave: list[PlanStep] = []
+        for step in steps:
+            if step.depends_on and step.depends_on in step_ids:
+                children_of.setdefault(step.depends_on, []).append(step)
+            else:
+                wave.append(step)
+
+        waves: list[list[PlanStep]] = []
+        while wave:
+            waves.append(wave)
+            wave = [child for step in wave for child in children_of.get(step.id, ())]
+        return waves
+
+    def _validate_selection(self, entity_name: str, selection: NormalizedSelectionNode) -> None:
+        """
+        Check every relation and expand of a selection against the graph.
+
+        Runs once per query shape (before planning), so the planning loop
+        can index the graph directly.
+
+        Raises:
+            PlanningError: With the dotted path of the first invalid node
+        """
+        stack = [(entity_name, selection, entity_name)]
+        while stack:
+            entity_name, selection, path = stack.pop()
+            relations = self._entity_info[entity_name].relations
+            for relation_name, relation_selection in selection.relations.items():
+                relation_path = f"{path}.{relation_name}"
+                relation_def = relations.get(relation_name)
+                if not relation_def:
+                    raise PlanningError("relation not found", path=relation_path)
+                target = relation_def.get("target")
+                if target not in self._entity_info:
+                    raise PlanningError(f"target entity '{target}' not found", path=relation_path)
+                stack.append((target, relation_selection, relation_path))
+            for expand_name, expand_node in selection.expand.items():
+                if expand_node.target_entity not in self._entity_info:
+                    raise PlanningError(
+                        f"target entity '{expand_node.target_entity}' not found",
+                        path=f"{path}.{expand_name}",
+                    )
+
+    def _build_plan(self, query: NormalizedQuery) -> list[PlanStep]:
+        """Build execution plan from scratch (see plan())."""
         self._step_counter = 0
+        self._fusable = set()
         steps: list[PlanStep] = []
 
-        # Get root entity definition
-        entity_def = self.entities.get(query.entity)
-        if not entity_def:
-            raise ValueError(f"Entity '{query.entity}' not found in graph")
+        root_step = self._create_root_step(query)
+        steps.append(root_step)
 
-        # Create root step
-        root_step = self._create_step(
+        # Plan nested relations and expands (belongsTo) at every level
+        self._plan_relations(
+            selection=query.select,
+            parent_entity_def=self.entities[query.entity],
+            parent_step=root_step,
+            steps=steps,
+        )
+
+        return self._fuse_sibling_steps(steps)
+
+    def _create_root_step(self, query: NormalizedQuery) -> PlanStep:
+        """Create the step fetching the query's root entity."""
+        return self._create_step(
             entity_name=query.entity,
-            entity_def=entity_def,
+            entity_def=self.entities[query.entity],
             selection=query.select,
             filters=query.filters,
             parent_step_id=None,
@@ -120,65 +622,95 @@ class QueryPlanner:
             child_match_field=None,
             required_fields=[],  # No extra required fields for root
         )
-        steps.append(root_step)
 
-        # Plan nested relations
-        self._plan_relations(
-            selection=query.select,
-            parent_entity_def=entity_def,
-            parent_step=root_step,
-            steps=steps,
-        )
+    def _fuse_sibling_steps(self, steps: list[PlanStep]) -> list[PlanStep]:
+        """
+        Merge sibling steps that fetch the same rows into one step.
 
-        # Plan expand (belongsTo) relations
-        self._plan_expand(
-            selection=query.select,
-            parent_step=root_step,
-            steps=steps,
-        )
+        Two leaf steps under the same parent with the same entity, linking
+        fields, graph filters, order, pagination and selected fields return
+        the same rows: the first one also attaches its results under the
+        other's name (alias_attach_as). Steps selecting different fields are
+        not fused - attached rows are shared, so every name would expose
+        the union of both selections.
 
-        return steps
+        Only leaf steps without client filters are fused, so the decision
+        depends on the query shape alone (safe for cached plan templates).
+        """
+        if len(self._fusable) < 2:
+            return steps
+
+        primaries: dict[tuple, PlanStep] = {}
+        fused: list[PlanStep] = []
+        for step in steps:
+            key = self._fusion_key(step) if step.id in self._fusable else None
+            if key is not None:
+                primary = primaries.get(key)
+                if primary is not None:
+                    primary.alias_attach_as.append((step.attach_as, step.cardinality))
+                    continue
+                primaries[key] = step
+            fused.append(step)
+        return fused
+
+    def _fusion_key(self, step: PlanStep) -> Optional[tuple]:
+        """Key identifying the rows a step fetches (None if not hashable)."""
+        key = (
+            step.depends_on,
+            step.entity,
+            step.service,
+            step.parent_key_field,
+            step.child_match_field,
+            step.is_expand,
+            step.expand_fk_field,
+            step.select_fields,
+            tuple((f.field, f.op, f.value) for f in step.filters),
+            tuple((o.field, o.dir) for o in step.order),
+            step.limit,
+            step.offset,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
 
     def _create_step(
         self,
         entity_name: str,
         entity_def: dict,
         selection: NormalizedSelectionNode,
-        filters: list[NormalizedFilter],
+        filters: Sequence[NormalizedFilter],
         parent_step_id: Optional[str],
         attach_as: Optional[str],
         cardinality: Literal["one", "many"] | None,
         parent_key_field: Optional[str],
         child_match_field: Optional[str],
-        required_fields: list[str],
+        required_fields: Sequence[str],
     ) -> PlanStep:
         """Create a single plan step."""
-        service_name = entity_def.get("service")
+        info = self._entity_info[entity_name]
+        service_name = info.service
 
-        # Start with user-requested fields
-        fields = list(selection.fields)
+        # Start with user-requested fields (dict keeps order, O(1) dedupe)
+        fields = dict.fromkeys(selection.fields)
 
         # Add entity keys (always needed for linking)
-        keys = entity_def.get("keys", ["id"])
-        for key in keys:
-            if key not in fields:
-                fields.append(key)
+        fields.update(dict.fromkeys(info.keys))
 
         # Add child_match_field (needed for parent to link to us)
-        if child_match_field and child_match_field not in fields:
-            fields.append(child_match_field)
+        if child_match_field:
+            fields[child_match_field] = None
 
         # Add any extra required fields (for chaining to next level)
-        for rf in required_fields:
-            if rf not in fields:
-                fields.append(rf)
+        fields.update(dict.fromkeys(required_fields))
 
         return PlanStep(
             id=self._next_step_id(entity_name),
             entity=entity_name,
             service=service_name,
             filters=filters,
-            select_fields=fields,
+            select_fields=tuple(fields),
             order=selection.order,
             limit=selection.limit,
             offset=selection.offset,
@@ -199,90 +731,87 @@ class QueryPlanner:
         """
         Plan steps for nested relations.
 
-        Recursively creates PlanSteps for each relation in the selection.
+        Walks the selection tree breadth-first with a work queue (no
+        recursion, so nesting depth is unbounded) and creates PlanSteps for
+        each relation and expand. Parents are always planned before
+        children.
         For provider relations (through Relationship), creates TWO steps:
         1. Fetch Relationship records matching parent IDs
         2. Fetch target entities using IDs from Relationship records
         """
-        for relation_name, relation_selection in selection.relations.items():
-            relation_def = parent_entity_def.get("relations", {}).get(relation_name)
-            if not relation_def:
-                continue
-
-            target_entity_name = relation_def.get("target")
-            target_entity_def = self.entities.get(target_entity_name)
-            if not target_entity_def:
-                continue
-
-            cardinality = relation_def.get("cardinality", "many")
-            kind = relation_def.get("kind", "")
-
-            # Handle provider relations (two-hop through Relationship)
-            if kind == "provider":
-                final_step = self._plan_provider_relation(
-                    relation_name=relation_name,
-                    relation_def=relation_def,
-                    relation_selection=relation_selection,
-                    parent_entity_def=parent_entity_def,
-                    parent_step=parent_step,
-                    target_entity_name=target_entity_name,
-                    target_entity_def=target_entity_def,
-                    cardinality=cardinality,
-                    steps=steps,
-                )
-                if final_step:
-                    # Recursively plan nested relations
-                    self._plan_relations(
-                        selection=relation_selection,
-                        parent_entity_def=target_entity_def,
-                        parent_step=final_step,
+        work = deque([(selection, parent_entity_def, parent_step)])
+        while work:
+            selection, parent_entity_def, parent_step = work.popleft()
+            parent_info = self._entity_info[parent_step.entity]
+
+            for relation_name, relation_selection in selection.relations.items():
+                # Validated up-front (_validate_selection)
+                relation_def = parent_info.relations[relation_name]
+                target_entity_name = relation_def["target"]
+                target_entity_def = self.entities[target_entity_name]
+
+                cardinality = relation_def.get("cardinality", "many")
+                kind = relation_def.get("kind", "")
+
+                # Handle provider relations (two-hop through Relationship)
+                if kind == "provider":
+                    final_step = self._plan_provider_relation(
+                        relation_name=relation_name,
+                        relation_def=relation_def,
+                        relation_selection=relation_selection,
+                        parent_entity_def=parent_entity_def,
+                        parent_step=parent_step,
+                        target_entity_name=target_entity_name,
+                        target_entity_def=target_entity_def,
+                        cardinality=cardinality,
                         steps=steps,
                     )
-                continue
-
-            # Handle ref and other relation types (single step)
-            parent_key_field, child_match_field, extra_filters, child_required_fields = (
-                self._resolve_relation_mapping(
-                    relation_def,
-                    parent_entity_def,
-                    target_entity_def,
-                    relation_selection,
+                    if final_step:
+                        # Plan nested relations of the target later
+                        work.append((relation_selection, target_entity_def, final_step))
+                    continue
+
+                # Handle ref and other relation types (single step).
+                # The mapping depends on the graph only: resolve once per relation
+                mapping = parent_info.mappings.get(relation_name)
+                if mapping is None:
+                    mapping = parent_info.mappings[relation_name] = self._resolve_relation_mapping(
+                        relation_def,
+                        parent_info,
+                        self._entity_info[target_entity_name],
+                    )
+                parent_key_field, child_match_field, extra_filters, child_required_fields = mapping
+
+                # Combine relation selection filters with any extra filters from relation definition
+                combined_filters = (*relation_selection.filters, *extra_filters)
+
+                # Create step for this relation
+                relation_step = self._create_step(
+                    entity_name=target_entity_name,
+                    entity_def=target_entity_def,
+                    selection=relation_selection,
+                    filters=combined_filters,
+                    parent_step_id=parent_step.id,
+                    attach_as=relation_name,
+                    cardinality=cardinality,
+                    parent_key_field=parent_key_field,
+                    child_match_field=child_match_field,
+                    required_fields=child_required_fields,
                 )
-            )
+                steps.append(relation_step)
+                if not (relation_selection.filters or relation_selection.relations or relation_selection.expand):
+                    self._fusable.add(relation_step.id)
 
-            # Combine relation selection filters with any extra filters from relation definition
-            combined_filters = list(relation_selection.filters) + extra_filters
-
-            # Create step for this relation
-            relation_step = self._create_step(
-                entity_name=target_entity_name,
-                entity_def=target_entity_def,
-                selection=relation_selection,
-                filters=combined_filters,
-                parent_step_id=parent_step.id,
-                attach_as=relation_name,
-                cardinality=cardinality,
-                parent_key_field=parent_key_field,
-                child_match_field=child_match_field,
-                required_fields=child_required_fields,
-            )
-            steps.append(relation_step)
+                # Plan nested relations later
+                work.append((relation_selection, target_entity_def, relation_step))
 
-            # Recursively plan nested relations
-            self._plan_relations(
-                selection=relation_selection,
-                parent_entity_def=target_entity_def,
-                parent_step=relation_step,
+            # Plan expand (belongsTo) at this level
+            self._plan_expand(
+                selection=selection,
+                parent_step=parent_step,
                 steps=steps,
             )
 
-        # Plan expand (belongsTo) at this level
-        self._plan_expand(
-            selection=selection,
-            parent_step=parent_step,
-            steps=steps,
-        )
-
     def _plan_expand(
         self,
         selection: NormalizedSelectionNode,
@@ -302,26 +831,19 @@ class QueryPlanner:
         """
         for expand_name, expand_node in selection.expand.items():
             target_entity = expand_node.target_entity
-            target_entity_def = self.entities.get(target_entity)
-            if not target_entity_def:
-                continue
-
-            # Start with requested fields
-            fields = list(expand_node.fields)
 
-            # Always include "id" for matching
-            if "id" not in fields:
-                fields.append("id")
+            # Start with requested fields, always include "id" for matching
+            fields = tuple(dict.fromkeys([*expand_node.fields, "id"]))
 
             # Create expand step
             # Note: filters will be added at execution time (id IN unique_fk_values)
             expand_step = PlanStep(
                 id=self._next_step_id(target_entity),
                 entity=target_entity,
-                service=target_entity_def.get("service"),
-                filters=[],  # Will be populated at execution time
+                service=self._entity_info[target_entity].service,
+                filters=(),  # Will be populated at execution time
                 select_fields=fields,
-                order=[],
+                order=(),
                 limit=None,  # Get all matching parents
                 offset=0,
                 depends_on=parent_step.id,
@@ -333,6 +855,7 @@ class QueryPlanner:
                 expand_fk_field=expand_node.fk_field,  # FK field for reverse lookup
             )
             steps.append(expand_step)
+            self._fusable.add(expand_step.id)
 
     def _plan_provider_relation(
         self,
@@ -355,61 +878,38 @@ class QueryPlanner:
 
         Returns the final target step for recursive planning.
         """
-        # Get provider config
-        provider_name = relation_def.get("provider", "relations_db")
-        provider = self.graph.get("relation_providers", {}).get(provider_name, {})
-
-        # Provider field names
-        subject_field = provider.get("subject_field", "subject_id")
-        object_field = provider.get("object_field", "object_id")
-        type_field = provider.get("type_field", "relationship_type")
-        status_field = provider.get("status_field", "status")
+        provider = self._provider_for(relation_def)
+        parent_match_field, target_id_field = _direction_fields(
+            relation_def.get("direction", "out"), provider
+        )
 
         # Provider entity (Relationship)
-        provider_entity_name = provider.get("entity", "Relationship")
-        provider_entity_def = self.entities.get(provider_entity_name)
-        provider_service = provider.get("service", "relations")
-
-        if not provider_entity_def:
-            # Fallback: create minimal entity def for Relationship
-            provider_entity_def = {
-                "service": provider_service,
-                "keys": ["id"],
-                "fields": {},
-            }
-
-        direction = relation_def.get("direction", "out")
-
-        # Determine which fields to use based on direction
-        # direction="in": parent.id matches subject_id, get object_id for target
-        # direction="out": parent.id matches object_id, get subject_id for target
-        if direction == "in":
-            parent_match_field = subject_field  # e.g., "subject_id"
-            target_id_field = object_field      # e.g., "object_id"
-        else:
-            parent_match_field = object_field   # e.g., "object_id"
-            target_id_field = subject_field     # e.g., "subject_id"
+        provider_entity_name = provider.entity
+        provider_service = provider.service
 
         # Parent key field
-        parent_keys = parent_entity_def.get("keys", ["id"])
-        parent_key_field = parent_keys[0]
+        parent_key_field = self._entity_info[parent_step.entity].first_key
 
-        # Build filters for Relationship step
-        rel_filters: list[NormalizedFilter] = []
-
-        # Add type filter
-        rel_type = relation_def.get("type")
-        if rel_type:
-            rel_filters.append(
-                NormalizedFilter(field=type_field, op="eq", value=rel_type)
+        # Denormalized edges: query the target directly by its inverse FK
+        if self._can_skip_relationship_hop(relation_def, target_entity_def, provider):
+            target_step = self._create_step(
+                entity_name=target_entity_name,
+                entity_def=target_entity_def,
+                selection=relation_selection,
+                filters=list(relation_selection.filters)
+                + self._relation_predicates(relation_def, provider),
+                parent_step_id=parent_step.id,
+                attach_as=relation_name,
+                cardinality=cardinality,
+                parent_key_field=parent_key_field,
+                child_match_field=relation_def["inverse_fk"],
+                required_fields=[relation_def["inverse_fk"]],
             )
+            steps.append(target_step)
+            return target_step
 
-        # Add status filter
-        status = relation_def.get("status")
-        if status:
-            rel_filters.append(
-                NormalizedFilter(field=status_field, op="eq", value=status)
-            )
+        # Build filters for Relationship step (type/status)
+        rel_filters = self._relation_predicates(relation_def, provider)
 
         # Step 1: Fetch Relationship records
         # Fields needed: the target_id_field (to link to target entity)
@@ -418,8 +918,7 @@ class QueryPlanner:
             entity=provider_entity_name,
             service=provider_service,
             filters=rel_filters,
-            select_fields=[target_id_field, parent_match_field],
-            order=[],
+            select_fields=(target_id_field, parent_match_field),
             limit=None,  # Get all matching relationships
             offset=0,
             depends_on=parent_step.id,
@@ -431,19 +930,16 @@ class QueryPlanner:
         steps.append(rel_step)
 
         # Step 2: Fetch target entities using IDs from Relationship
-        target_keys = target_entity_def.get("keys", ["id"])
-        target_key = target_keys[0]
+        target_info = self._entity_info[target_entity_name]
+        target_key = target_info.first_key
 
-        # Start with user-requested fields
-        target_fields = list(relation_selection.fields)
-        # Always include the key field
-        if target_key not in target_fields:
-            target_fields.append(target_key)
+        # Start with user-requested fields, always include the key field
+        target_fields = tuple(dict.fromkeys([*relation_selection.fields, target_key]))
 
         target_step = PlanStep(
             id=self._next_step_id(target_entity_name),
             entity=target_entity_name,
-            service=target_entity_def.get("service"),
+            service=target_info.service,
             filters=list(relation_selection.filters),  # User filters on target
             select_fields=target_fields,
             order=relation_selection.order,
@@ -463,16 +959,62 @@ class QueryPlanner:
 
         return target_step
 
+    def _provider_for(self, relation_def: dict) -> _ProviderInfo:
+        """Resolved provider config of a provider relation."""
+        return self._providers.get(relation_def.get("provider", "relations_db"), _DEFAULT_PROVIDER)
+
+    @staticmethod
+    def _relation_predicates(relation_def: dict, provider: _ProviderInfo) -> list[NormalizedFilter]:
+        """Type/status filters a provider relation applies to its edges."""
+        predicates: list[NormalizedFilter] = []
+        if relation_def.get("type"):
+            predicates.append(
+                NormalizedFilter(field=provider.type_field, op="eq", value=relation_def["type"])
+            )
+        if relation_def.get("status"):
+            predicates.append(
+                NormalizedFilter(field=provider.status_field, op="eq", value=relation_def["status"])
+            )
+        return predicates
+
+    @staticmethod
+    def _can_skip_relationship_hop(
+        relation_def: dict,
+        target_entity_def: dict,
+        provider: _ProviderInfo,
+    ) -> bool:
+        """
+        Check if a provider relation can be fetched as a single ref-style step.
+
+        Opt-in per relation:
+        - inverse_fk: target field holding the parent key (must exist on target)
+        - inline_provider_filters: type/status predicates may be applied to
+          the target's own columns (required if the relation has any)
+        """
+        inverse_fk = relation_def.get("inverse_fk")
+        target_fields = target_entity_def.get("fields", {})
+        if not inverse_fk or inverse_fk not in target_fields:
+            return False
+
+        predicates = QueryPlanner._relation_predicates(relation_def, provider)
+        if not predicates:
+            return True
+        return bool(relation_def.get("inline_provider_filters")) and all(
+            p.field in target_fields for p in predicates
+        )
+
     def _resolve_relation_mapping(
         self,
         relation_def: dict,
-        parent_entity_def: dict,
-        target_entity_def: dict,
-        relation_selection: NormalizedSelectionNode,
-    ) -> tuple[str, str, list[NormalizedFilter], list[str]]:
+        parent_info: _EntityInfo,
+        target_info: _EntityInfo,
+    ) -> tuple[str, str, tuple[NormalizedFilter, ...], tuple[str, ...]]:
         """
         Resolve how to link parent results to child query.
 
+        Pure function of the graph; results are cached per relation in
+        _EntityInfo.mappings (hence tuples).
+
         Returns:
             Tuple of (parent_key_field, child_match_field, extra_filters, child_required_fields)
             - parent_key_field: field to extract from parent items
@@ -487,50 +1029,22 @@ class QueryPlanner:
 
         # New format: kind=provider (through relation provider like relations_db)
         if kind == "provider":
-            # Get provider config from graph
-            provider_name = relation_def.get("provider", "relations_db")
-            provider = self.graph.get("relation_providers", {}).get(provider_name, {})
-
-            subject_field = provider.get("subject_field", "subject_id")
-            object_field = provider.get("object_field", "object_id")
-            type_field = provider.get("type_field", "relationship_type")
-            status_field = provider.get("status_field", "status")
-
-            direction = relation_def.get("direction", "out")
+            provider = self._provider_for(relation_def)
+            child_match_field, target_key_field = _direction_fields(
+                relation_def.get("direction", "out"), provider
+            )
 
             # Parent key is typically "id"
-            parent_keys = parent_entity_def.get("keys", ["id"])
-            parent_key_field = parent_keys[0]
-
-            # Determine match field based on direction
-            # direction="out": parent.id -> relationship.object_id, get subject_id for target
-            # direction="in": parent.id -> relationship.subject_id, get object_id for target
-            if direction == "out":
-                child_match_field = object_field
-                target_key_field = subject_field
-            else:  # direction == "in"
-                child_match_field = subject_field
-                target_key_field = object_field
+            parent_key_field = parent_info.first_key
 
             # Child needs target_key_field for further chaining
             child_required_fields.append(target_key_field)
             child_required_fields.append(child_match_field)
 
-            # Add type filter if specified
-            rel_type = relation_def.get("type")
-            if rel_type:
-                extra_filters.append(
-                    NormalizedFilter(field=type_field, op="eq", value=rel_type)
-                )
-
-            # Add status filter if specified
-            status = relation_def.get("status")
-            if status:
-                extra_filters.append(
-                    NormalizedFilter(field=status_field, op="eq", value=status)
-                )
+            # Add type/status filters if specified
+            extra_filters.extend(self._relation_predicates(relation_def, provider))
 
-            return parent_key_field, child_match_field, extra_filters, child_required_fields
+            return parent_key_field, child_match_field, tuple(extra_filters), tuple(child_required_fields)
 
         # New format: kind=ref (direct FK relation)
         if kind == "ref":
@@ -543,10 +1057,8 @@ class QueryPlanner:
             # Child needs to return the match field
             child_required_fields.append(child_match_field)
 
-            return parent_key_field, child_match_field, extra_filters, child_required_fields
+            return parent_key_field, child_match_field, tuple(extra_filters), tuple(child_required_fields)
 
         # Fallback: relation without kind (should not happen after normalization)
         # Use standard id-based linking
-        parent_keys = parent_entity_def.get("keys", ["id"])
-        target_keys = target_entity_def.get("keys", ["id"])
-        return parent_keys[0], target_keys[0], extra_filters, child_required_fields
+        return parent_info.first_key, target_info.first_key, (), ()
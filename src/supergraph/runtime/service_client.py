@@ -10,16 +10,66 @@ from __future__ import annotations
 from typing import Any, List, Optional
 
 import httpx
+from pydantic import ValidationError as PydanticValidationError
 
 from ..core.errors import ServiceError
+from ..core.serialization import json_dumps, json_loads
 from ..core.query_types import (
-    InternalQueryRequest,
     InternalQueryResponse,
     NormalizedFilter,
     NormalizedOrder,
 )
 
 
+# Connection pool sized for parallel fan-out to backend services. Idle
+# connections are kept for a minute (httpx default: 5s) so bursty traffic
+# doesn't reconnect between queries.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0,
+)
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def create_http_client(timeout: float = 30.0) -> httpx.AsyncClient:
+    """
+    Create an HTTP client for internal service calls.
+
+    One client (and its keep-alive connection pool) can be shared by
+    ServiceClient and MutationExecutor.
+
+    Args:
+        timeout: Request timeout in seconds (connect timeout is capped at 5s)
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+        limits=DEFAULT_LIMITS,
+    )
+
+
+def _parse_query_response(content: bytes) -> InternalQueryResponse:
+    """
+    Parse a /internal/query response body.
+
+    Well-formed bodies are parsed and validated in one pass by pydantic's
+    compiled JSON validator; partial ones (e.g. no "total") fall back to
+    defaults.
+    """
+    try:
+        return InternalQueryResponse.model_validate_json(content)
+    except PydanticValidationError:
+        data = json_loads(content)
+        return InternalQueryResponse(
+            items=data.get("items", []),
+            total=data.get("total", 0),
+            limit=data.get("limit"),
+            offset=data.get("offset", 0),
+        )
+
+
 class ServiceClient:
     """
     HTTP client for internal service queries.
@@ -37,25 +87,27 @@ class ServiceClient:
         )
     """
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(self, timeout: float = 30.0, http_client: httpx.AsyncClient | None = None):
         """
         Initialize service client.
 
         Args:
             timeout: HTTP request timeout in seconds
+            http_client: Optional shared HTTP client
         """
         self.timeout = timeout
-        self._client: httpx.AsyncClient | None = None
+        self._client: httpx.AsyncClient | None = http_client
+        self._owns_client = http_client is None
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create async HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = create_http_client(self.timeout)
         return self._client
 
     async def close(self):
-        """Close the HTTP client."""
-        if self._client:
+        """Close the HTTP client if we own it."""
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
@@ -91,20 +143,19 @@ class ServiceClient:
 
         # Use unified endpoint at /internal/query (services use entity in request body)
         url = f"{service_url.rstrip('/')}/internal/query"
-        request = InternalQueryRequest(
-            entity=entity,
-            filters=filters,
-            fields=fields,
-            order=order or [],
-            limit=limit,
-            offset=offset,
-        )
+        # Inputs are already normalized: build the InternalQueryRequest body
+        # directly instead of validating and dumping a model
+        body = {
+            "entity": entity,
+            "filters": [{"field": f.field, "op": f.op, "value": f.value} for f in filters],
+            "fields": list(fields),
+            "order": [{"field": o.field, "dir": o.dir} for o in order or ()],
+            "limit": limit,
+            "offset": offset,
+        }
 
         try:
-            response = await client.post(
-                url,
-                json=request.model_dump(),
-            )
+            response = await client.post(url, content=json_dumps(body), headers=_JSON_HEADERS)
 
             if response.status_code != 200:
                 raise ServiceError(
@@ -113,13 +164,7 @@ class ServiceClient:
                     message=response.text,
                 )
 
-            data = response.json()
-            return InternalQueryResponse(
-                items=data.get("items", []),
-                total=data.get("total", 0),
-                limit=data.get("limit"),
-                offset=data.get("offset", 0),
-            )
+            return _parse_query_response(response.content)
 
         except httpx.RequestError as e:
             raise ServiceError(
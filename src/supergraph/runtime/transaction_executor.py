@@ -11,6 +11,7 @@ Handles multi-step transactions with:
 from __future__ import annotations
 
 
+import asyncio
 import re
 from typing import Any
 
@@ -62,6 +63,7 @@ class TransactionExecutor:
         """
         self.mutation_executor = mutation_executor
         self.query_executor = query_executor
+        self._id_keys: dict[str, str] = {}  # entity -> ID field found in its results
 
     async def execute(self, transaction: Transaction) -> TransactionResult:
         """
@@ -77,11 +79,40 @@ class TransactionExecutor:
         results: list[MutationResult] = []
         completed_creates: list[tuple[str, Any]] = []  # (entity, id) for rollback
 
+        steps = transaction.steps
+        # start index -> end index of create runs sent as one bulk create
+        create_runs = self._plan_create_runs(steps, transaction.on_error)
+
         try:
-            for step in transaction.steps:
-                # Resolve variable references in step data
-                resolved_data = self._resolve_refs(step.data, variables)
-                resolved_filters = self._resolve_refs(step.filters, variables)
+            index = 0
+            while index < len(steps):
+                end = create_runs.get(index)
+                if end is not None:
+                    failed = await self._execute_create_run(
+                        steps[index:end], transaction.on_error,
+                        variables, results, completed_creates,
+                    )
+                    index = end
+                    if failed is not None:
+                        await self._compensate(completed_creates)
+                        return TransactionResult(
+                            success=False,
+                            results=results,
+                            variables=variables,
+                            rolled_back=True,
+                            error=f"Step failed, rolled back: {failed.error}",
+                        )
+                    continue
+
+                step = steps[index]
+                index += 1
+
+                # Resolve variable references in step data (shared as-is if none)
+                if step.has_refs:
+                    resolved_data = self._resolve_refs(step.data, variables)
+                    resolved_filters = self._resolve_refs(step.filters, variables)
+                else:
+                    resolved_data, resolved_filters = step.data, step.filters
 
                 # Handle get_or_create specially
                 if step.operation == "get_or_create":
@@ -159,7 +190,7 @@ class TransactionExecutor:
 
                 # Track created records for potential rollback
                 if step.operation == "create" and result.success and result.data:
-                    record_id = self._get_record_id(result.data)
+                    record_id = self._get_record_id(step.entity, result.data)
                     if record_id is not None:
                         completed_creates.append((step.entity, record_id))
 
@@ -183,15 +214,123 @@ class TransactionExecutor:
                 )
             raise
 
+    @staticmethod
+    def _plan_create_runs(steps: list[TransactionStep], on_error: str) -> dict[int, int]:
+        """
+        Find runs of consecutive independent creates of one entity.
+
+        A run can be sent as one bulk create when no step in it references
+        an alias defined earlier in the same run (refs to aliases before the
+        run are resolved up front) and none declares explicit dependencies.
+        With on_error="stop" steps stay one request each: the service runs
+        the rest of a batch after a failure, and "stop" keeps those records.
+
+        Returns:
+            Mapping of run start index to end index (exclusive), runs of 2+
+        """
+        runs: dict[int, int] = {}
+        if on_error == "stop":
+            return runs
+
+        start = 0
+        while start < len(steps):
+            first = steps[start]
+            end = start + 1
+            if first.operation == "create" and not first.depends_on:
+                aliased = first.alias is not None
+                while end < len(steps):
+                    step = steps[end]
+                    if (
+                        step.operation != "create"
+                        or step.entity != first.entity
+                        or step.depends_on
+                        or (aliased and step.has_refs)
+                    ):
+                        break
+                    aliased = aliased or step.alias is not None
+                    end += 1
+                if end - start > 1:
+                    runs[start] = end
+            start = end
+        return runs
+
+    async def _execute_create_run(
+        self,
+        steps: list[TransactionStep],
+        on_error: str,
+        variables: dict[str, Any],
+        results: list[MutationResult],
+        completed_creates: list[tuple[str, Any]],
+    ) -> Optional[MutationResult]:
+        """
+        Execute a run of creates (see _plan_create_runs) as one bulk create.
+
+        Results, variables and created records are recorded as if the steps
+        ran one by one. Records the service created after a failed step are
+        still tracked, so a rollback deletes them too.
+
+        Returns:
+            First failed non-optional result when rolling back, else None
+        """
+        data = [
+            self._resolve_refs(step.data, variables) if step.has_refs else step.data
+            for step in steps
+        ]
+        # One result per record, in order (execute_batch guarantees it)
+        run_results = await self.mutation_executor.execute_bulk_create(
+            steps[0].entity, data, [step.response for step in steps]
+        )
+
+        failed: Optional[MutationResult] = None
+        for step, result in zip(steps, run_results):
+            if failed is None:
+                results.append(result)
+            if not result.success:
+                if failed is None and not step.optional and on_error == "rollback":
+                    failed = result
+                continue
+            if failed is None and step.alias and result.data:
+                variables[step.alias.lstrip("$")] = result.data
+            if result.data:
+                record_id = self._get_record_id(step.entity, result.data)
+                if record_id is not None:
+                    completed_creates.append((step.entity, record_id))
+        return failed
+
     async def _compensate(self, completed_creates: list[tuple[str, Any]]):
         """
         Execute compensation (delete) for all created records.
 
-        Processes in reverse order (LIFO).
+        Processes in reverse order (LIFO). Consecutive records of one
+        entity are deleted in a single request; services are compensated
+        concurrently (records in different services can't reference each
+        other at the database level), keeping LIFO order within a service.
         """
+        # Runs of consecutive (in LIFO order) creates of the same entity
+        runs: list[tuple[str, list[Any]]] = []
         for entity, record_id in reversed(completed_creates):
+            if runs and runs[-1][0] == entity:
+                runs[-1][1].append(record_id)
+            else:
+                runs.append((entity, [record_id]))
+
+        by_service: dict[Any, list[tuple[str, list[Any]]]] = {}
+        for entity, record_ids in runs:
+            try:
+                service = self.mutation_executor.get_service_url(entity)
+            except ExecutionError:
+                service = None  # Compensation reports the failure itself
+            by_service.setdefault(service, []).append((entity, record_ids))
+
+        await asyncio.gather(
+            *(self._compensate_runs(service_runs) for service_runs in by_service.values())
+        )
+
+    async def _compensate_runs(self, runs: list[tuple[str, list[Any]]]):
+        """Delete runs of created records of one service, in order."""
+        for entity, record_ids in runs:
             try:
-                await self.mutation_executor.execute_compensation(entity, record_id)
+                await self.mutation_executor.execute_compensation_batch(entity, record_ids)
             except Exception:
                 # Log but continue with remaining compensations
                 pass
@@ -271,19 +410,35 @@ class TransactionExecutor:
         - Mixed content
         """
         if isinstance(data, str):
+            # Most strings hold no reference: skip the regex entirely
+            if "$" not in data:
+                return data
+
+            # Whole-string "$var" / "$var.field" (the common case) without regex
+            if data[0] == "$":
+                var_name, dot, field_name = data[1:].partition(".")
+                if var_name.isidentifier() and (not dot or field_name.isidentifier()):
+                    return self._get_var_value(var_name, field_name or None, variables)
+
             # Check if entire string is a variable reference
             match = VAR_PATTERN.fullmatch(data)
             if match:
                 var_name, field_name = match.groups()
                 return self._get_var_value(var_name, field_name, variables)
 
-            # Check for embedded references
-            def replace_ref(m):
+            # Replace embedded references in a single scan
+            parts = []
+            pos = 0
+            for m in VAR_PATTERN.finditer(data):
                 var_name, field_name = m.groups()
                 value = self._get_var_value(var_name, field_name, variables)
-                return str(value) if value is not None else m.group(0)
-
-            return VAR_PATTERN.sub(replace_ref, data)
+                parts.append(data[pos:m.start()])
+                parts.append(str(value) if value is not None else m.group(0))
+                pos = m.end()
+            if not parts:
+                return data
+            parts.append(data[pos:])
+            return "".join(parts)
 
         elif isinstance(data, dict):
             return {k: self._resolve_refs(v, variables) for k, v in data.items()}
@@ -311,10 +466,16 @@ class TransactionExecutor:
 
         return value
 
-    def _get_record_id(self, data: dict[str, Any]) -> Any:
+    def _get_record_id(self, entity: str, data: dict[str, Any]) -> Any:
         """Extract record ID from mutation result."""
+        # Results of one entity use the same ID field: try the known one first
+        key = self._id_keys.get(entity)
+        if key is not None and key in data:
+            return data[key]
+
         # Try common ID field names
         for key in ("id", "pk", "_id"):
             if key in data:
+                self._id_keys[entity] = key
                 return data[key]
         return None
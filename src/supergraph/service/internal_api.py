@@ -7,6 +7,7 @@ Provides generic CRUD endpoints that services can mount:
 - POST /internal/update - Partial update (PATCH)
 - POST /internal/rewrite - Full replace (PUT)
 - POST /internal/delete - Delete records
+- POST /internal/batch - Several mutations in one request
 
 Usage:
     from supergraph.service import create_internal_router
@@ -31,6 +32,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
 from supergraph.core.query_types import (
+    InternalBatchRequest,
+    InternalBatchResponse,
+    InternalBatchResult,
     InternalQueryRequest,
     InternalQueryResponse,
     InternalMutationRequest,
@@ -94,8 +98,24 @@ class InternalRouter:
         ) -> InternalMutationResponse:
             return await self._handle_delete(request, session)
 
+        @router.post("/internal/batch")
+        async def internal_batch(
+            request: InternalBatchRequest,
+            session: AsyncSession = Depends(self.get_session),
+        ) -> InternalBatchResponse:
+            return await _handle_batch(request, session, self._batch_handler)
+
         return router
 
+    def _batch_handler(self, operation: InternalMutationRequest) -> InternalRouter:
+        """Handler for a batch operation; rejects operations on other entities."""
+        if operation.entity != self.model.__name__:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown entity: {operation.entity}. Available: ['{self.model.__name__}']",
+            )
+        return self
+
     async def _handle_query(
         self,
         request: InternalQueryRequest,
@@ -444,6 +464,42 @@ class InternalRouter:
         return coerced
 
 
+# Mutation handlers available in /internal/batch
+_BATCH_HANDLERS = {
+    "create": InternalRouter._handle_create,
+    "update": InternalRouter._handle_update,
+    "rewrite": InternalRouter._handle_rewrite,
+    "delete": InternalRouter._handle_delete,
+}
+
+
+async def _handle_batch(
+    request: InternalBatchRequest,
+    session: AsyncSession,
+    get_handler: Callable[[InternalMutationRequest], InternalRouter],
+) -> InternalBatchResponse:
+    """
+    Handle batch request.
+
+    Runs operations in order. A failed operation is rolled back and
+    reported in its result; the remaining operations still run.
+    """
+    results = []
+    for operation in request.operations:
+        try:
+            handle = _BATCH_HANDLERS.get(operation.operation)
+            if handle is None:
+                raise HTTPException(status_code=400, detail=f"Unsupported operation: {operation.operation}")
+            response = await handle(get_handler(operation), operation, session)
+            results.append(InternalBatchResult(items=response.items, count=response.count))
+        except Exception as e:
+            await session.rollback()
+            error = e.detail if isinstance(e, HTTPException) else str(e)
+            results.append(InternalBatchResult(error=str(error)))
+
+    return InternalBatchResponse(results=results)
+
+
 def create_internal_router(
     model: type[ModelT],
     get_session: Callable[[], AsyncSession],
@@ -548,6 +604,17 @@ class UnifiedInternalRouter:
             handler = InternalRouter(model, self.get_session)
             return await handler._handle_delete(request, session)
 
+        @router.post("/internal/batch", response_model=InternalBatchResponse)
+        async def internal_batch(
+            request: InternalBatchRequest,
+            session: AsyncSession = Depends(self.get_session),
+        ) -> InternalBatchResponse:
+            return await _handle_batch(
+                request,
+                session,
+                lambda operation: InternalRouter(self._get_model(operation.entity), self.get_session),
+            )
+
         return router
 
 
@@ -0,0 +1,125 @@
+"""Tests for model event publishing."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from supergraph.messaging import events
+from supergraph.messaging.events import EventConfig, publish_model_event, publish_model_events
+from supergraph.messaging.pubsub import RedisPublisher
+
+
+class Camera:
+    def __init__(self, id: int, mac_address: str):
+        self.id = id
+        self.mac_address = mac_address
+
+
+class FakePublisher:
+    """Records publishes; reports subscribers as configured."""
+
+    def __init__(self, subscribed: bool = True):
+        self.subscribed = subscribed
+        self.sent: list[tuple[str, dict]] = []
+
+    def has_subscribers(self, channel: str) -> bool:
+        return self.subscribed
+
+    async def publish(self, channel: str, data: dict) -> int:
+        self.sent.append((channel, data))
+        return 1
+
+    async def publish_many(self, items: list[tuple[str, dict]]) -> list[int]:
+        self.sent.extend(items)
+        return [1] * len(items)
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """Count get_publisher calls; returns (calls, install(publisher or error))."""
+    calls: list[str | None] = []
+
+    def install(result):
+        def fake_get_publisher(redis_url=None):
+            calls.append(redis_url)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        monkeypatch.setattr(events, "get_publisher", fake_get_publisher)
+
+    return calls, install
+
+
+@pytest.fixture
+def subscriber_ttl(monkeypatch):
+    monkeypatch.setattr(RedisPublisher, "no_subscriber_ttl", 2.0)
+
+
+CREATED = EventConfig(publish={"create": "camera.created"}, payload_fields=["id"])
+UPDATED = EventConfig(publish={"update": "camera.updated"}, payload_fields=["id"], publish_batch=True)
+
+
+async def test_publish_model_event_looks_up_publisher_once(lookups):
+    calls, install = lookups
+    publisher = FakePublisher()
+    install(publisher)
+
+    await publish_model_event(CREATED, "create", Camera(1, "AA"))
+
+    assert len(calls) == 1
+    assert publisher.sent == [("camera.created", {"operation": "create", "id": 1})]
+
+
+async def test_publish_model_event_reuses_publisher_from_subscriber_check(lookups, subscriber_ttl):
+    calls, install = lookups
+    publisher = FakePublisher()
+    install(publisher)
+
+    await publish_model_event(CREATED, "create", Camera(1, "AA"))
+
+    assert len(calls) == 1
+    assert len(publisher.sent) == 1
+
+
+async def test_publish_model_event_skips_channel_without_subscribers(lookups, subscriber_ttl):
+    _, install = lookups
+    publisher = FakePublisher(subscribed=False)
+    install(publisher)
+
+    await publish_model_event(CREATED, "create", Camera(1, "AA"))
+
+    assert publisher.sent == []
+
+
+async def test_publish_model_event_logs_publisher_error_once(lookups, subscriber_ttl, caplog):
+    _, install = lookups
+    install(RuntimeError("redis unavailable"))
+
+    with caplog.at_level(logging.DEBUG, logger=events.logger.name):
+        await publish_model_event(CREATED, "create", Camera(1, "AA"))
+
+    assert [r.levelno for r in caplog.records].count(logging.ERROR) == 1
+
+
+async def test_publish_model_events_survives_publisher_error(lookups, subscriber_ttl, caplog):
+    _, install = lookups
+    install(RuntimeError("redis unavailable"))
+
+    with caplog.at_level(logging.DEBUG, logger=events.logger.name):
+        await publish_model_events(UPDATED, "update", [Camera(1, "AA"), Camera(2, "BB")])
+
+    assert [r.levelno for r in caplog.records].count(logging.ERROR) == 1
+
+
+async def test_publish_model_events_publishes_batch_through_one_publisher(lookups):
+    calls, install = lookups
+    publisher = FakePublisher()
+    install(publisher)
+
+    await publish_model_events(UPDATED, "update", [Camera(1, "AA"), Camera(2, "BB")])
+
+    assert len(calls) == 1
+    assert [channel for channel, _ in publisher.sent] == ["camera.updated", "camera.updated"]
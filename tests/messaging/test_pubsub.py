@@ -0,0 +1,44 @@
+"""Tests for Redis pub/sub helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from supergraph.messaging import client as client_module
+from supergraph.messaging import pubsub
+from supergraph.messaging.client import close_redis
+from supergraph.messaging.pubsub import get_publisher
+
+
+@pytest.fixture
+def client_lookups(monkeypatch):
+    """Count get_redis_client calls; each call before close_redis returns the same client."""
+    calls: list[str | None] = []
+    client = object()
+
+    def fake_get_redis_client(redis_url=None):
+        calls.append(redis_url)
+        return client
+
+    monkeypatch.setattr(pubsub, "get_redis_client", fake_get_redis_client)
+    pubsub.reset_publisher()
+    yield calls
+    pubsub.reset_publisher()
+
+
+def test_get_publisher_looks_up_client_once(client_lookups):
+    first = get_publisher("redis://a:6379")
+
+    assert get_publisher() is first
+    assert get_publisher("redis://b:6379") is first
+    assert len(client_lookups) == 1
+
+
+async def test_close_redis_drops_shared_publisher(client_lookups, monkeypatch):
+    monkeypatch.setattr(client_module, "_global_client", None)
+    first = get_publisher("redis://a:6379")
+
+    await close_redis()
+
+    assert get_publisher("redis://a:6379") is not first
+    assert len(client_lookups) == 2
@@ -0,0 +1,111 @@
+"""Tests for PlanExecutor."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from supergraph.core.query_types import InternalQueryResponse, NormalizedFilter
+from supergraph.runtime.executor import PlanExecutor
+from supergraph.runtime.planner import PlanStep
+
+
+def _contacts_step(*filters: NormalizedFilter, id: str = "step_contact_2", depends_on: str = "step_person_1") -> PlanStep:
+    return PlanStep(
+        id=id,
+        entity="Contact",
+        service="person",
+        filters=filters,
+        select_fields=("id", "person_id"),
+        depends_on=depends_on,
+        parent_key_field="id",
+        child_match_field="person_id",
+    )
+
+
+def test_restrict_keys_narrows_keys_of_the_filter_type():
+    step = _contacts_step(NormalizedFilter(field="person_id", op="in", value=[1, 3]))
+
+    assert PlanExecutor._restrict_keys(step, [1, 2, 3]) == [1, 3]
+
+
+def test_restrict_keys_narrows_to_nothing_for_eq():
+    step = _contacts_step(NormalizedFilter(field="person_id", op="eq", value=4))
+
+    assert PlanExecutor._restrict_keys(step, [1, 2, 3]) == []
+
+
+def test_restrict_keys_leaves_int_keys_with_str_filter_values_to_the_service():
+    step = _contacts_step(NormalizedFilter(field="person_id", op="in", value=["1", "3"]))
+
+    assert PlanExecutor._restrict_keys(step, [1, 2, 3]) == [1, 2, 3]
+
+
+def test_restrict_keys_leaves_coercible_values_to_the_service():
+    step = _contacts_step(NormalizedFilter(field="person_id", op="in", value=[1.0, Decimal("2.00")]))
+
+    assert PlanExecutor._restrict_keys(step, [1, 2, 3]) == [1, 2, 3]
+
+
+def test_restrict_keys_leaves_mixed_parent_keys_to_the_service():
+    step = _contacts_step(NormalizedFilter(field="person_id", op="in", value=[1, 2]))
+
+    assert PlanExecutor._restrict_keys(step, ["1", 2, 3]) == ["1", 2, 3]
+
+
+def test_restrict_keys_ignores_filters_on_other_fields():
+    step = _contacts_step(NormalizedFilter(field="value", op="eq", value="x"))
+
+    assert PlanExecutor._restrict_keys(step, [1, 2]) == [1, 2]
+
+
+class CoercingClient:
+    """Service stub matching IN keys the way a database column would (numerically)."""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.calls: list[list] = []
+
+    async def fetch(self, service_url, entity, filters, fields, order=None, limit=None, offset=0):
+        keys = filters[0].value
+        self.calls.append(list(keys))
+        wanted = {Decimal(str(k)) for k in keys}
+        items = [dict(row) for row in self.rows if Decimal(str(row["person_id"])) in wanted]
+        return InternalQueryResponse(items=items, total=len(items), limit=None, offset=0)
+
+
+class Context:
+    def get_service_url(self, service):
+        return "http://person"
+
+
+def _parents(step_id: str, ids: list) -> dict[str, InternalQueryResponse]:
+    items = [{"id": i} for i in ids]
+    return {step_id: InternalQueryResponse(items=items, total=len(items), limit=None, offset=0)}
+
+
+async def test_shared_fetch_scatters_rows_to_their_steps():
+    client = CoercingClient([{"id": 10, "person_id": 1}, {"id": 20, "person_id": 2}])
+    group = [
+        _contacts_step(id="a", depends_on="p1"),
+        _contacts_step(id="b", depends_on="p2"),
+    ]
+    results = {**_parents("p1", [1]), **_parents("p2", [2])}
+
+    responses = await PlanExecutor(client)._execute_group(group, results, Context())
+
+    assert len(client.calls) == 1
+    assert [[row["id"] for row in r.items] for r in responses] == [[10], [20]]
+
+
+async def test_shared_fetch_refetches_per_step_when_rows_matched_by_coercion():
+    client = CoercingClient([{"id": 10, "person_id": "1.00"}, {"id": 20, "person_id": "2.00"}])
+    group = [
+        _contacts_step(id="a", depends_on="p1"),
+        _contacts_step(id="b", depends_on="p2"),
+    ]
+    results = {**_parents("p1", [1]), **_parents("p2", [2])}
+
+    responses = await PlanExecutor(client)._execute_group(group, results, Context())
+
+    assert client.calls == [[1, 2], [1], [2]]
+    assert [[row["id"] for row in r.items] for r in responses] == [[10], [20]]
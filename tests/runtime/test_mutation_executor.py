@@ -0,0 +1,135 @@
+"""Tests for MutationExecutor batching."""
+
+from __future__ import annotations
+
+import json
+
+from supergraph.core.request_parser import EntityMutation
+from supergraph.runtime.mutation_executor import MutationExecutor
+
+GRAPH = {
+    "services": {"person": {"url": "http://person"}, "camera": {"url": "http://camera"}},
+    "entities": {
+        "Person": {"service": "person", "keys": ["id"], "fields": {"id": {}, "name": {}}},
+        "Camera": {"service": "camera", "keys": ["id"], "fields": {"id": {}, "model": {}}},
+    },
+}
+
+
+class Response:
+    def __init__(self, status_code: int, payload=None):
+        self.status_code = status_code
+        self.payload = payload
+        self.text = json.dumps(payload)
+
+    def json(self):
+        return self.payload
+
+
+class HTTPClient:
+    """Records POSTs; answers /internal/batch with one created item per operation."""
+
+    def __init__(self, batch=None):
+        self.posts: list[tuple[str, dict]] = []
+        self.batch = batch  # Overrides the /internal/batch answer
+
+    async def post(self, url, content, headers=None):
+        body = json.loads(content)
+        self.posts.append((url, body))
+        if url.endswith("/internal/batch"):
+            if self.batch is not None:
+                return self.batch
+            return Response(200, {"results": [_created(op) for op in body["operations"]]})
+        return Response(200, _created(body))
+
+
+def _created(operation: dict) -> dict:
+    return {"items": [{"id": len(operation["data"]), **operation["data"]}], "count": 1}
+
+
+def _create(entity: str, **data) -> EntityMutation:
+    return EntityMutation(entity=entity, operation="create", data=data)
+
+
+def _paths(client: HTTPClient) -> list[tuple[str, int]]:
+    return [
+        (url, len(body["operations"]) if "operations" in body else 1)
+        for url, body in client.posts
+    ]
+
+
+async def test_execute_batch_keeps_request_order_across_services():
+    client = HTTPClient()
+    mutations = [
+        _create("Person", name="a"),
+        _create("Person", name="b"),
+        _create("Camera", model="x"),
+        _create("Person", name="c"),
+        _create("Person", name="d"),
+    ]
+
+    results = await MutationExecutor(GRAPH, client).execute_batch(mutations)
+
+    assert _paths(client) == [
+        ("http://person/internal/batch", 2),
+        ("http://camera/internal/create", 1),
+        ("http://person/internal/batch", 2),
+    ]
+    assert [r.entity for r in results] == ["Person", "Person", "Camera", "Person", "Person"]
+    assert [r.data.get("name", r.data.get("model")) for r in results] == ["a", "b", "x", "c", "d"]
+
+
+async def test_execute_batch_falls_back_when_service_has_no_batch_endpoint():
+    client = HTTPClient(batch=Response(404, {"detail": "Not Found"}))
+    executor = MutationExecutor(GRAPH, client)
+    mutations = [_create("Person", name="a"), _create("Person", name="b")]
+
+    results = await executor.execute_batch(mutations)
+    await executor.execute_batch(mutations)
+
+    assert executor._no_batch_urls == {"http://person"}
+    assert [url for url, _ in client.posts] == [
+        "http://person/internal/batch",
+        "http://person/internal/create",
+        "http://person/internal/create",
+        # Batch endpoint is not tried again
+        "http://person/internal/create",
+        "http://person/internal/create",
+    ]
+    assert all(r.success for r in results)
+
+
+async def test_execute_batch_falls_back_on_method_not_allowed():
+    client = HTTPClient(batch=Response(405, {"detail": "Method Not Allowed"}))
+    executor = MutationExecutor(GRAPH, client)
+
+    results = await executor.execute_batch([_create("Person", name="a"), _create("Person", name="b")])
+
+    assert "http://person" in executor._no_batch_urls
+    assert [r.data["name"] for r in results] == ["a", "b"]
+
+
+async def test_execute_batch_reports_per_operation_errors():
+    client = HTTPClient(batch=Response(200, {"results": [
+        {"items": [{"id": 1, "name": "a"}], "count": 1},
+        {"error": "duplicate name"},
+        {"items": [{"id": 3, "name": "c"}], "count": 1},
+    ]}))
+    mutations = [_create("Person", name="a"), _create("Person", name="a"), _create("Person", name="c")]
+
+    results = await MutationExecutor(GRAPH, client).execute_batch(mutations)
+
+    assert [r.success for r in results] == [True, False, True]
+    assert results[1].error == "Service error: duplicate name"
+    assert results[2].data == {"id": 3, "name": "c"}
+
+
+async def test_execute_batch_fails_every_operation_on_result_count_mismatch():
+    client = HTTPClient(batch=Response(200, {"results": [{"items": [{"id": 1}], "count": 1}]}))
+    mutations = [_create("Person", name="a"), _create("Person", name="b")]
+
+    results = await MutationExecutor(GRAPH, client).execute_batch(mutations)
+
+    assert not any(r.success for r in results)
+    assert all(r.error.startswith("Execution error") for r in results)
+    assert all("Batch returned 1 results for 2 operations" in r.error for r in results)
@@ -0,0 +1,173 @@
+"""Tests for QueryPlanner."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pytest
+
+from supergraph.core.query_types import NormalizedFilter, NormalizedQuery, NormalizedSelectionNode
+from supergraph.runtime import planner
+from supergraph.runtime.planner import QueryPlanner
+
+CONTACTS = {
+    "target": "Contact",
+    "kind": "ref",
+    "cardinality": "many",
+    "ref": {"from_field": "id", "to_field": "person_id"},
+}
+
+GRAPH = {
+    "services": {"person": {"url": "http://person"}},
+    "entities": {
+        "Person": {
+            "service": "person",
+            "keys": ["id"],
+            "fields": {"id": {}, "name": {}},
+            "relations": {"contacts": CONTACTS, "emails": dict(CONTACTS)},
+        },
+        "Contact": {
+            "service": "person",
+            "keys": ["id"],
+            "fields": {"id": {}, "person_id": {}, "value": {}, "kind": {}},
+            "relations": {},
+        },
+    },
+}
+
+
+def _select(fields, relations=None, filters=()) -> NormalizedSelectionNode:
+    return NormalizedSelectionNode(
+        fields=list(fields), filters=list(filters), order=[], limit=None, offset=0, relations=relations or {}
+    )
+
+
+def _plan(contacts_fields, emails_fields):
+    query = NormalizedQuery(
+        action="query",
+        entity="Person",
+        filters=[],
+        select=_select(
+            ["id"],
+            {"contacts": _select(contacts_fields), "emails": _select(emails_fields)},
+        ),
+    )
+    return QueryPlanner(GRAPH).plan(query)
+
+
+def test_sibling_steps_with_same_fields_are_fused():
+    steps = _plan(["value"], ["value"])
+
+    assert len(steps) == 2
+    assert steps[1].attach_as == "contacts"
+    assert list(steps[1].alias_attach_as) == [("emails", "many")]
+
+
+def test_sibling_steps_with_disjoint_fields_are_not_fused():
+    steps = _plan(["value"], ["kind"])
+
+    assert [step.attach_as for step in steps[1:]] == ["contacts", "emails"]
+    contacts, emails = steps[1], steps[2]
+    assert "kind" not in contacts.select_fields
+    assert "value" not in emails.select_fields
+    assert not contacts.alias_attach_as and not emails.alias_attach_as
+
+
+# --- Plan templates ---
+
+CAMERAS = {
+    "target": "Camera",
+    "kind": "provider",
+    "cardinality": "many",
+    "type": "owns",
+    "inverse_fk": "owner_id",
+    "inline_provider_filters": True,
+}
+
+TEMPLATE_GRAPH = {
+    "services": {"person": {"url": "http://person"}},
+    "entities": {
+        "Person": {
+            "service": "person",
+            "keys": ["id"],
+            "fields": {"id": {}, "name": {}},
+            "relations": {"contacts": CONTACTS, "cameras": CAMERAS},
+        },
+        "Contact": GRAPH["entities"]["Contact"],
+        "Camera": {
+            "service": "person",
+            "keys": ["id"],
+            "fields": {"id": {}, "owner_id": {}, "model": {}, "relationship_type": {}},
+            "relations": {},
+        },
+    },
+}
+
+
+@pytest.fixture
+def plan_cache(monkeypatch):
+    cache = OrderedDict()
+    monkeypatch.setattr(planner, "_plan_cache", cache)
+    return cache
+
+
+def _filtered_query(name: str, kind: str, model: str) -> NormalizedQuery:
+    return NormalizedQuery(
+        action="query",
+        entity="Person",
+        filters=[NormalizedFilter(field="name", op="eq", value=name)],
+        select=_select(
+            ["id"],
+            {
+                "contacts": _select(["value"], filters=[NormalizedFilter(field="kind", op="eq", value=kind)]),
+                "cameras": _select(["id"], filters=[NormalizedFilter(field="model", op="eq", value=model)]),
+            },
+        ),
+    )
+
+
+def _values(steps) -> dict[str, list]:
+    return {step.attach_as or "root": [(f.field, f.value) for f in step.filters] for step in steps}
+
+
+def _template_state(cache) -> list:
+    ((_, template),) = cache.values()
+    return [(list(frozen.filters), frozen.guard, source, count) for frozen, source, count in template]
+
+
+def test_same_shape_with_other_filter_values_reuses_template(plan_cache):
+    planner_ = QueryPlanner(TEMPLATE_GRAPH)
+
+    first = planner_.plan(_filtered_query("ann", "email", "x1"))
+    state = _template_state(plan_cache)
+    second = planner_.plan(_filtered_query("bob", "phone", "x2"))
+
+    assert len(plan_cache) == 1
+    assert _values(first) == {
+        "root": [("name", "ann")],
+        "contacts": [("kind", "email")],
+        "cameras": [("model", "x1"), ("relationship_type", "owns")],
+    }
+    assert _values(second) == {
+        "root": [("name", "bob")],
+        "contacts": [("kind", "phone")],
+        "cameras": [("model", "x2"), ("relationship_type", "owns")],
+    }
+    assert _template_state(plan_cache) == state
+
+
+def test_plans_from_template_do_not_share_guard_or_filters(plan_cache):
+    planner_ = QueryPlanner(TEMPLATE_GRAPH)
+    first = planner_.plan(_filtered_query("ann", "email", "x1"))
+    state = _template_state(plan_cache)
+
+    # IAM adds guards to the steps of a plan after planning
+    second = planner_.plan(_filtered_query("bob", "phone", "x2"))
+    for step in second:
+        step.guard = (NormalizedFilter(field="id", op="in", value=[1]),)
+    third = planner_.plan(_filtered_query("cid", "fax", "x3"))
+
+    assert all(step.guard == () for step in first + third)
+    assert _values(first)["root"] == [("name", "ann")]
+    assert _values(third)["cameras"] == [("model", "x3"), ("relationship_type", "owns")]
+    assert _template_state(plan_cache) == state
@@ -0,0 +1,174 @@
+"""Tests for TransactionExecutor."""
+
+from __future__ import annotations
+
+from supergraph.core.query_types import MutationResult
+from supergraph.core.request_parser import Transaction, TransactionStep
+from supergraph.runtime.transaction_executor import TransactionExecutor
+
+
+def _create(entity: str, data: dict, alias: str | None = None, **kwargs) -> TransactionStep:
+    return TransactionStep(operation="create", entity=entity, data=data, alias=alias, **kwargs)
+
+
+class FakeMutationExecutor:
+    """Assigns sequential IDs; fails records whose data has "fail"."""
+
+    def __init__(self):
+        self.calls: list[tuple] = []
+        self.next_id = 0
+
+    def _create(self, entity: str, data: dict) -> MutationResult:
+        if data.get("fail"):
+            return MutationResult(entity=entity, operation="create", success=False, error="invalid")
+        self.next_id += 1
+        return MutationResult(
+            entity=entity, operation="create", success=True, data={"id": self.next_id, **data}, count=1
+        )
+
+    async def execute(self, mutation):
+        self.calls.append(("execute", mutation.entity, mutation.data))
+        return self._create(mutation.entity, mutation.data)
+
+    async def execute_bulk_create(self, entity, data, responses=None):
+        self.calls.append(("bulk", entity, list(data)))
+        # Like /internal/batch: later records still run after a failure
+        return [self._create(entity, values) for values in data]
+
+    def get_service_url(self, entity):
+        return "http://person"
+
+    async def execute_compensation_batch(self, entity, record_ids):
+        self.calls.append(("delete", entity, list(record_ids)))
+        return True
+
+    async def execute_compensation(self, entity, record_id):
+        return await self.execute_compensation_batch(entity, [record_id])
+
+
+def test_plan_create_runs_groups_consecutive_creates_of_one_entity():
+    steps = [
+        _create("Person", {"name": "a"}),
+        _create("Person", {"name": "b"}),
+        _create("Contact", {"value": "x"}),
+        _create("Contact", {"value": "y"}),
+        _create("Contact", {"value": "z"}),
+    ]
+
+    assert TransactionExecutor._plan_create_runs(steps, "rollback") == {0: 2, 2: 5}
+
+
+def test_plan_create_runs_allows_aliases_without_refs_inside_run():
+    steps = [
+        _create("Person", {"name": "a"}, alias="$a"),
+        _create("Person", {"name": "b"}, alias="$b"),
+    ]
+
+    assert TransactionExecutor._plan_create_runs(steps, "rollback") == {0: 2}
+
+
+def test_plan_create_runs_ends_run_at_ref_to_alias_inside_run():
+    steps = [
+        _create("Person", {"name": "a"}, alias="$a"),
+        _create("Person", {"name": "b"}),
+        _create("Person", {"parent_id": "$a.id"}),
+        _create("Person", {"name": "c"}),
+    ]
+
+    assert TransactionExecutor._plan_create_runs(steps, "rollback") == {0: 2, 2: 4}
+
+
+def test_plan_create_runs_keeps_refs_to_aliases_before_run():
+    steps = [
+        TransactionStep(operation="update", entity="Person", data={"name": "a"}, alias="$a"),
+        _create("Contact", {"person_id": "$a.id"}),
+        _create("Contact", {"person_id": "$a.id"}),
+    ]
+
+    assert TransactionExecutor._plan_create_runs(steps, "rollback") == {1: 3}
+
+
+def test_plan_create_runs_skips_steps_with_dependencies():
+    steps = [
+        _create("Person", {"name": "a"}),
+        _create("Person", {"name": "b"}, depends_on=["$x"]),
+        _create("Person", {"name": "c"}),
+    ]
+
+    assert TransactionExecutor._plan_create_runs(steps, "rollback") == {}
+
+
+def test_plan_create_runs_disabled_for_stop():
+    steps = [_create("Person", {"name": "a"}), _create("Person", {"name": "b"})]
+
+    assert TransactionExecutor._plan_create_runs(steps, "stop") == {}
+
+
+async def test_run_results_and_aliases_match_step_by_step_execution():
+    mutations = FakeMutationExecutor()
+    transaction = Transaction(steps=[
+        _create("Person", {"name": "a"}, alias="$a"),
+        _create("Person", {"name": "b"}),
+        _create("Contact", {"person_id": "$a.id"}),
+    ])
+
+    result = await TransactionExecutor(mutations).execute(transaction)
+
+    assert result.success
+    assert [r.data["id"] for r in result.results] == [1, 2, 3]
+    assert result.variables["a"]["id"] == 1
+    assert mutations.calls == [
+        ("bulk", "Person", [{"name": "a"}, {"name": "b"}]),
+        ("execute", "Contact", {"person_id": 1}),
+    ]
+
+
+async def test_rollback_compensates_records_created_after_failed_step():
+    mutations = FakeMutationExecutor()
+    transaction = Transaction(steps=[
+        _create("Person", {"name": "a"}),
+        _create("Person", {"fail": True}),
+        _create("Person", {"name": "c"}),
+    ])
+
+    result = await TransactionExecutor(mutations).execute(transaction)
+
+    assert not result.success and result.rolled_back
+    # Results stop at the failed step, as in step-by-step execution
+    assert [r.success for r in result.results] == [True, False]
+    # The service still created "c" (id 2): it is deleted too
+    assert mutations.calls[-1] == ("delete", "Person", [2, 1])
+
+
+async def test_continue_records_every_result_of_a_run():
+    mutations = FakeMutationExecutor()
+    transaction = Transaction(
+        steps=[
+            _create("Person", {"name": "a"}),
+            _create("Person", {"fail": True}),
+            _create("Person", {"name": "c"}),
+        ],
+        on_error="continue",
+    )
+
+    result = await TransactionExecutor(mutations).execute(transaction)
+
+    assert result.success
+    assert [r.success for r in result.results] == [True, False, True]
+
+
+async def test_stop_executes_creates_one_by_one():
+    mutations = FakeMutationExecutor()
+    transaction = Transaction(
+        steps=[
+            _create("Person", {"name": "a"}),
+            _create("Person", {"fail": True}),
+            _create("Person", {"name": "c"}),
+        ],
+        on_error="stop",
+    )
+
+    result = await TransactionExecutor(mutations).execute(transaction)
+
+    assert not result.success and not result.rolled_back
+    assert [call[0] for call in mutations.calls] == ["execute", "execute"]
@@ -0,0 +1,103 @@
+"""Tests for the internal API batch endpoint."""
+
+from __future__ import annotations
+
+import pytest
+
+from supergraph.core.query_types import (
+    InternalBatchRequest,
+    InternalMutationRequest,
+    InternalMutationResponse,
+)
+from supergraph.service import internal_api
+from supergraph.service.internal_api import InternalRouter, _handle_batch
+
+
+class Person:
+    pass
+
+
+class Session:
+    def __init__(self):
+        self.rollbacks = 0
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def handled(monkeypatch):
+    """Replace batch handlers; records (operation, data) and fails data with "fail"."""
+    calls: list[tuple[str, dict]] = []
+
+    def handler(operation):
+        async def handle(router, request, session):
+            calls.append((operation, request.data))
+            if request.data.get("fail"):
+                raise ValueError("constraint violated")
+            return InternalMutationResponse(items=[dict(request.data)], count=1)
+
+        return handle
+
+    for operation in ("create", "update", "rewrite", "delete"):
+        monkeypatch.setitem(internal_api._BATCH_HANDLERS, operation, handler(operation))
+    return calls
+
+
+def _operation(operation: str, entity: str = "Person", **data) -> InternalMutationRequest:
+    return InternalMutationRequest(entity=entity, operation=operation, data=data)
+
+
+def _batch(*operations: InternalMutationRequest) -> InternalBatchRequest:
+    return InternalBatchRequest(operations=list(operations))
+
+
+async def test_handle_batch_runs_operations_in_order(handled):
+    router = InternalRouter(Person, None)
+    request = _batch(_operation("create", name="a"), _operation("update", name="b"))
+
+    response = await _handle_batch(request, Session(), router._batch_handler)
+
+    assert handled == [("create", {"name": "a"}), ("update", {"name": "b"})]
+    assert [r.items for r in response.results] == [[{"name": "a"}], [{"name": "b"}]]
+    assert all(r.error is None for r in response.results)
+
+
+async def test_handle_batch_rolls_back_failed_operation_and_continues(handled):
+    session = Session()
+    router = InternalRouter(Person, None)
+    request = _batch(
+        _operation("create", name="a"),
+        _operation("create", fail=True),
+        _operation("create", name="c"),
+    )
+
+    response = await _handle_batch(request, session, router._batch_handler)
+
+    assert [r.error for r in response.results] == [None, "constraint violated", None]
+    assert response.results[2].items == [{"name": "c"}]
+    assert session.rollbacks == 1
+
+
+async def test_handle_batch_rejects_unsupported_operation(handled):
+    session = Session()
+    router = InternalRouter(Person, None)
+    request = _batch(_operation("get_or_create", name="a"), _operation("create", name="b"))
+
+    response = await _handle_batch(request, session, router._batch_handler)
+
+    assert response.results[0].error == "Unsupported operation: get_or_create"
+    assert response.results[1].error is None
+    assert handled == [("create", {"name": "b"})]
+
+
+async def test_handle_batch_rejects_operations_on_other_entities(handled):
+    session = Session()
+    router = InternalRouter(Person, None)
+    request = _batch(_operation("create", entity="Camera", model="x"))
+
+    response = await _handle_batch(request, session, router._batch_handler)
+
+    assert response.results[0].error == "Unknown entity: Camera. Available: ['Person']"
+    assert handled == []
+    assert session.rollbacks == 1